@@ -0,0 +1,90 @@
+# Copyright (c) Nex-AGI. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Early keystroke capture
+Buffers what the user types while the agent is initializing so it can be replayed into the next prompt
+"""
+
+import os
+import re
+import select
+import sys
+import threading
+from typing import Optional
+
+try:
+    import termios
+    import tty
+except ImportError:  # Not a POSIX terminal (e.g. Windows): capture is a no-op
+    termios = None
+
+_ESCAPE_SEQ_RE = re.compile(r'\x1b(?:\[[0-9;?]*[ -/]*[@-~]|O.)?')
+
+_buffer = bytearray()
+_stop = threading.Event()
+_thread: Optional[threading.Thread] = None
+_saved_attrs = None
+
+
+def _reader(fd: int) -> None:
+    while not _stop.is_set():
+        readable, _, _ = select.select([fd], [], [], 0.05)
+        if readable:
+            data = os.read(fd, 1024)
+            if not data:
+                break
+            _buffer.extend(data)
+
+
+def start_capture() -> None:
+    """Switch the terminal to cbreak mode and start buffering keystrokes in a background thread"""
+    global _thread, _saved_attrs
+
+    if termios is None or _thread is not None or not sys.stdin.isatty():
+        return
+
+    fd = sys.stdin.fileno()
+    _saved_attrs = termios.tcgetattr(fd)
+    # cbreak rather than raw: keystrokes arrive immediately, but Ctrl-C still raises KeyboardInterrupt
+    tty.setcbreak(fd)
+    _stop.clear()
+    _thread = threading.Thread(target=_reader, args=(fd,), daemon=True)
+    _thread.start()
+
+
+def drain() -> str:
+    """Stop capturing, restore the terminal and return the buffered text (editing keys applied)"""
+    global _thread, _saved_attrs
+
+    if _thread is None:
+        return ""
+
+    _stop.set()
+    _thread.join()
+    _thread = None
+    termios.tcsetattr(sys.stdin.fileno(), termios.TCSANOW, _saved_attrs)
+    _saved_attrs = None
+
+    text = _ESCAPE_SEQ_RE.sub('', _buffer.decode('utf-8', errors='ignore'))
+    _buffer.clear()
+
+    chars = []
+    for ch in text:
+        if ch in ('\x7f', '\b'):
+            if chars:
+                chars.pop()
+        elif ch.isprintable():
+            chars.append(ch)
+    return ''.join(chars)
@@ -17,17 +17,60 @@ Kaggle dataset download tool
 Downloads datasets from Kaggle using the kagglehub library
 """
 
+import errno
 import os
 import shutil
-from typing import Any, Dict
+from typing import Any, Dict, Iterator
 
 try:
-    from dotenv import load_dotenv
-    load_dotenv()
+    from ._env_cache import load_dotenv_cached
+    load_dotenv_cached()
 except ImportError:
     pass
 
 
+def _iter_rel_files(base: str) -> Iterator[str]:
+    """Yield every file under base as a path relative to base (same entries as os.walk)"""
+    prefix_len = len(os.path.join(base, ""))
+    stack = [base]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    # Like os.walk, list symlinked directories but don't descend into them
+                    if not entry.is_symlink():
+                        stack.append(entry.path)
+                else:
+                    yield entry.path[prefix_len:]
+
+
+def _fast_copyfile(src: str, dst: str) -> None:
+    """
+    Copy file contents in-kernel with os.copy_file_range (a reflink on btrfs/xfs),
+    falling back to shutil.copyfile where the syscall is unavailable or unsupported
+    """
+    if hasattr(os, "copy_file_range"):
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            try:
+                while os.copy_file_range(fsrc.fileno(), fdst.fileno(), 1 << 24):
+                    pass
+                return
+            except OSError as e:
+                if e.errno not in (errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP):
+                    raise
+    shutil.copyfile(src, dst)
+
+
+def _link_or_copy(src: str, dst: str) -> str:
+    """Hard-link src to dst, falling back to a regular copy (e.g. across filesystems)"""
+    try:
+        os.link(src, dst)
+    except OSError:
+        _fast_copyfile(src, dst)
+        shutil.copystat(src, dst)
+    return dst
+
+
 def KaggleDownload(dataset_name: str, download_path: str) -> Dict[str, Any]:
     """
     Download a Kaggle dataset to the specified path using kagglehub library.
@@ -81,19 +124,14 @@ def KaggleDownload(dataset_name: str, download_path: str) -> Dict[str, Any]:
         if not os.path.exists(download_path):
             os.makedirs(download_path, exist_ok=True)
 
-        # Copy data from cache path to target path
+        # Mirror data from cache path to target path (hard links where possible, no byte copy)
         target_path = os.path.join(download_path, os.path.basename(dataset_name))
         if os.path.exists(target_path):
             shutil.rmtree(target_path)
-        shutil.copytree(cache_path, target_path)
+        shutil.copytree(cache_path, target_path, copy_function=_link_or_copy)
 
         # List downloaded files
-        downloaded_files = []
-        for root, _, files in os.walk(target_path):
-            for file in files:
-                file_path = os.path.join(root, file)
-                rel_path = os.path.relpath(file_path, target_path)
-                downloaded_files.append(rel_path)
+        downloaded_files = list(_iter_rel_files(target_path))
 
         return {
             "success": True,
@@ -16,12 +16,26 @@
 DatavisSearchAgent tools package
 """
 
-from .http_server_tool import http_server
-from .interactive_python_executor_tool import interactive_python_executor
-from .KaggleDownload_tool import KaggleDownload
+import importlib
+
+# Tool name -> submodule that defines it, imported on first attribute access (PEP 562)
+_LAZY_TOOLS = {
+    'http_server': 'http_server_tool',
+    'interactive_python_executor': 'interactive_python_executor_tool',
+    'KaggleDownload': 'KaggleDownload_tool',
+}
 
 __all__ = [
     'http_server',
     'interactive_python_executor',
     'KaggleDownload',
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_TOOLS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,53 @@
+# Copyright (c) Nex-AGI. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Memoized .env loading
+Lets start.py and the tools share one parse of the same .env file per process
+"""
+
+import os
+from typing import Dict, Optional, Tuple
+
+from dotenv import find_dotenv, load_dotenv
+
+# (absolute path, mtime in ns) -> result of load_dotenv
+_CACHE: Dict[Tuple[str, int], bool] = {}
+
+
+def load_dotenv_cached(dotenv_path: Optional[str] = None) -> bool:
+    """
+    Load a .env file into os.environ, skipping the parse if this exact file
+    version has already been loaded. Editing the file changes its mtime, so
+    the next call picks up the new contents.
+
+    Args:
+        dotenv_path: Path to the .env file (searched upwards from this package if omitted)
+
+    Returns:
+        bool: True if the file was found and its variables were loaded
+    """
+    dotenv_path = dotenv_path or find_dotenv()
+    if not dotenv_path:
+        return False
+
+    path = os.path.abspath(dotenv_path)
+    try:
+        key = (path, os.stat(path).st_mtime_ns)
+    except OSError:
+        return False
+
+    if key not in _CACHE:
+        _CACHE[key] = load_dotenv(path)
+    return _CACHE[key]
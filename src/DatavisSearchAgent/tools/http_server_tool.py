@@ -18,17 +18,19 @@ Starts a non-blocking local HTTP server for dashboard display
 """
 
 import os
-import shlex
 import socket
 import subprocess
 from typing import Any, Dict
 
 
 def _is_port_open(port: int) -> bool:
-    """Check if a port is already in use"""
+    """Check if a port is already in use (a bind attempt fails at once, with no connect timeout)"""
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        s.settimeout(0.3)
-        return s.connect_ex(("127.0.0.1", port)) == 0
+        try:
+            s.bind(("127.0.0.1", port))
+        except OSError:
+            return True
+        return False
 
 
 def _find_available_port(start: int, max_tries: int = 10) -> int:
@@ -46,7 +48,8 @@ def _find_available_port(start: int, max_tries: int = 10) -> int:
 def http_server(serve_dir: str, port: int = 8765) -> Dict[str, Any]:
     """
     Start a non-blocking HTTP server using UV: uv run python -m http.server {port} --directory {serve_dir}.
-    Returns accessible URL and startup log. Paths are properly escaped and quoted. Port conflicts are auto-incremented.
+    Returns the accessible URL. The server is spawned from an argv list (no shell), so paths need no quoting.
+    Port conflicts are auto-incremented.
 
     Args:
         serve_dir: Directory to serve (absolute path)
@@ -74,11 +77,11 @@ def http_server(serve_dir: str, port: int = 8765) -> Dict[str, Any]:
 
         # Find available port
         port = _find_available_port(port)
-        quoted_dir = shlex.quote(serve_dir)
-        cmd = f"uv run python -m http.server {port} --directory {quoted_dir}"
+        args = ["uv", "run", "python", "-m", "http.server", str(port), "--directory", serve_dir]
 
-        # Start non-blocking background process
-        proc = subprocess.Popen(cmd, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        # Start non-blocking background process directly, without an intermediate /bin/sh.
+        # Output is discarded: nothing reads it, and a full pipe would block the server's request log.
+        subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         url = f"http://127.0.0.1:{port}/"
 
         return {
@@ -17,16 +17,116 @@ Interactive Python executor tool for stateful code execution
 Maintains persistent execution context across multiple calls
 """
 
+import ast
+import asyncio
+import inspect
 import io
+import itertools
+import reprlib
 import traceback
 import contextlib
-from typing import Dict, Any
+import functools
+import threading
+import types
+from typing import Dict, Any, Optional, Tuple
 
 # Global execution context: all variables are preserved here
 _GLOBAL_CONTEXT = {
     "__builtins__": __builtins__,  # Allow basic built-in functions
 }
 
+# Reused stdout capture buffer; the lock serializes calls, since redirect_stdout
+# swaps the process-wide sys.stdout anyway
+_STDOUT_BUF = io.StringIO()
+_EXEC_LOCK = threading.Lock()
+# Set while a thread is executing code, so a nested call from that code is refused
+# instead of blocking forever on _EXEC_LOCK
+_EXEC_STATE = threading.local()
+
+# Event loop for code using top-level await, kept across calls like the variables
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+_COMPILE_FLAGS = ast.PyCF_ALLOW_TOP_LEVEL_AWAIT
+
+# Longest trailing-expression repr returned; a bare `data` on a large list or dict
+# would otherwise flood the tool result
+_MAX_RESULT_CHARS = 10_000
+
+
+class _ResultRepr(reprlib.Repr):
+    """reprlib.Repr that keeps dict insertion order, as repr() does"""
+
+    def repr_dict(self, x, level):
+        if not x:
+            return '{}'
+        if level <= 0:
+            return '{...}'
+        pieces = [
+            f"{self.repr1(key, level - 1)}: {self.repr1(val, level - 1)}"
+            for key, val in itertools.islice(x.items(), self.maxdict)
+        ]
+        if len(x) > self.maxdict:
+            pieces.append('...')
+        return '{' + ', '.join(pieces) + '}'
+
+
+# Only the first items of large containers are ever rendered, so a trailing `data`
+# costs no more than the capped text it produces
+_RESULT_REPR = _ResultRepr()
+_RESULT_REPR.maxlevel = 20
+_RESULT_REPR.maxlist = _RESULT_REPR.maxtuple = _RESULT_REPR.maxdict = 1000
+_RESULT_REPR.maxset = _RESULT_REPR.maxfrozenset = _RESULT_REPR.maxdeque = _RESULT_REPR.maxarray = 1000
+_RESULT_REPR.maxstring = _RESULT_REPR.maxlong = _RESULT_REPR.maxother = _MAX_RESULT_CHARS
+
+
+@functools.lru_cache(maxsize=128)
+def _compile(code: str) -> Tuple[types.CodeType, Optional[types.CodeType]]:
+    """
+    Parse user code once and compile it into (body, trailing expression) code objects.
+    A trailing expression is compiled in eval mode so its value can be returned, as in a REPL.
+    Re-running the same snippet skips the parser and compiler entirely.
+    """
+    tree = compile(code, "<string>", "exec", _COMPILE_FLAGS | ast.PyCF_ONLY_AST)
+    last_expr = None
+    if tree.body and isinstance(tree.body[-1], ast.Expr):
+        last_expr = compile(ast.Expression(tree.body.pop().value), "<string>", "eval", _COMPILE_FLAGS)
+    return compile(tree, "<string>", "exec", _COMPILE_FLAGS), last_expr
+
+
+def _run(code_obj: types.CodeType) -> Any:
+    """Evaluate a code object in the persistent context, awaiting it if it uses top-level await"""
+    global _LOOP
+
+    result = eval(code_obj, _GLOBAL_CONTEXT)
+    if code_obj.co_flags & inspect.CO_COROUTINE:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            result.close()
+            raise RuntimeError("Top-level await is not supported when the executor is called from a running event loop")
+        if _LOOP is None:
+            _LOOP = asyncio.new_event_loop()
+        result = _LOOP.run_until_complete(result)
+    return result
+
+
+def _result_repr(value: Any) -> Optional[str]:
+    """
+    repr() of a trailing expression value, capped at _MAX_RESULT_CHARS.
+    A failing __repr__ is reported here rather than failing a run whose code already executed.
+    """
+    if value is None:
+        return None
+    try:
+        text = _RESULT_REPR.repr(value)
+    except Exception as e:
+        return f"<repr() failed: {type(e).__name__}: {e}>"
+    if len(text) > _MAX_RESULT_CHARS:
+        text = text[:_MAX_RESULT_CHARS] + "... (truncated)"
+    return text
+
 
 def interactive_python_executor(code: str, reset: bool = False) -> Dict[str, Any]:
     """
@@ -40,28 +140,49 @@ def interactive_python_executor(code: str, reset: bool = False) -> Dict[str, Any
         Dict[str, Any]: Contains the following fields:
             - ok: True if execution succeeded, False otherwise
             - stdout: Captured standard output
+            - result: repr() of the value of a trailing expression, truncated to 10000 characters
+              (None if there is none or it is None)
             - error: Error message and traceback (None if successful)
     """
     global _GLOBAL_CONTEXT
 
+    if getattr(_EXEC_STATE, "active", False):
+        return {
+            "ok": False,
+            "stdout": "",
+            "result": None,
+            "error": "interactive_python_executor cannot be called from the code it is executing"
+        }
+
     # Reset context if requested
     if reset:
         _GLOBAL_CONTEXT = {
             "__builtins__": __builtins__,
         }
+        _compile.cache_clear()
 
-    buf = io.StringIO()
-    with contextlib.redirect_stdout(buf):
-        try:
-            exec(code, _GLOBAL_CONTEXT)
-            return {
-                "ok": True,
-                "stdout": buf.getvalue(),
-                "error": None
-            }
-        except Exception:
-            return {
-                "ok": False,
-                "stdout": buf.getvalue(),
-                "error": traceback.format_exc()
-            }
+    with _EXEC_LOCK:
+        _EXEC_STATE.active = True
+        buf = _STDOUT_BUF
+        buf.seek(0)
+        buf.truncate()
+        with contextlib.redirect_stdout(buf):
+            try:
+                body, last_expr = _compile(code)
+                _run(body)
+                value = _run(last_expr) if last_expr is not None else None
+                return {
+                    "ok": True,
+                    "stdout": buf.getvalue(),
+                    "result": _result_repr(value),
+                    "error": None
+                }
+            except Exception:
+                return {
+                    "ok": False,
+                    "stdout": buf.getvalue(),
+                    "result": None,
+                    "error": traceback.format_exc()
+                }
+            finally:
+                _EXEC_STATE.active = False
@@ -18,15 +18,24 @@ This module contains custom tool implementations that are configured
 via YAML files in the tools/ directory.
 """
 
-from .paper2md_tool import pdf_to_markdown_tool
-from .time_tool import get_current_time, format_time
-from .logo_manager_tool import logo_manager_tool
-from .gen_qr_code_tool import gen_qr_code_tool
-from .height_detect_tool import height_detect_tool
-from .image_caption_tool import image_caption_tool
-from .layout_balance_tool import layout_balance_tool
-from .poster_tool import poster_tool
-from .screenshot_tool import screenshot_tool
+import importlib
+
+# Tool name -> submodule that defines it. Submodules are imported on first
+# attribute access (PEP 562) so that loading one tool, e.g. through a YAML
+# binding, does not pull in every tool's dependencies.
+_LAZY_TOOLS = {
+    "pdf_to_markdown_tool": "paper2md_tool",
+    "get_current_time": "time_tool",
+    "format_time": "time_tool",
+    "logo_manager_tool": "logo_manager_tool",
+    "gen_qr_code_tool": "gen_qr_code_tool",
+    "height_detect_tool": "height_detect_tool",
+    "height_detect_tool_batch": "height_detect_tool",
+    "image_caption_tool": "image_caption_tool",
+    "layout_balance_tool": "layout_balance_tool",
+    "poster_tool": "poster_tool",
+    "screenshot_tool": "screenshot_tool",
+}
 
 __all__ = [
     "pdf_to_markdown_tool",
@@ -35,8 +44,18 @@ __all__ = [
     "logo_manager_tool",
     "gen_qr_code_tool",
     "height_detect_tool",
+    "height_detect_tool_batch",
     "image_caption_tool",
     "layout_balance_tool",
     "poster_tool",
     "screenshot_tool",
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_TOOLS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
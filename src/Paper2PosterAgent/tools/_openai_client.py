@@ -0,0 +1,57 @@
+# Copyright (c) Nex-AGI. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Shared OpenAI clients
+Lets the tools reuse one client, and its connection pool, per endpoint per process
+"""
+
+import atexit
+import threading
+from typing import Any, Dict, Tuple
+
+# (base_url, api_key) -> OpenAI client, closed at interpreter exit
+_CLIENTS: Dict[Tuple[str, str], Any] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def get_openai_client(base_url: str, api_key: str) -> Any:
+    """
+    Return the shared OpenAI client for an endpoint, creating it on first use.
+    openai is imported lazily, so callers should check it is installed first.
+
+    Args:
+        base_url: API base URL
+        api_key: API key
+
+    Returns:
+        openai.OpenAI: Client shared by every caller using the same endpoint and key
+    """
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get((base_url, api_key))
+        if client is None:
+            from openai import OpenAI
+
+            client = _CLIENTS[(base_url, api_key)] = OpenAI(base_url=base_url, api_key=api_key)
+        return client
+
+
+@atexit.register
+def _close_clients() -> None:
+    """Close the cached clients' HTTP connection pools"""
+    with _CLIENTS_LOCK:
+        clients = list(_CLIENTS.values())
+        _CLIENTS.clear()
+    for client in clients:
+        client.close()
@@ -19,35 +19,21 @@ Extracts arXiv links from PDF first page screenshot and generates corresponding
 
 import os
 import base64
+import hashlib
+import importlib.util
 import json
 import re
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from io import BytesIO
 
-# Check dependencies
-try:
-    from pdf2image import convert_from_path
-    PDF2IMAGE_AVAILABLE = True
-except ImportError:
-    PDF2IMAGE_AVAILABLE = False
-
-try:
-    import qrcode
-    QRCODE_AVAILABLE = True
-except ImportError:
-    QRCODE_AVAILABLE = False
-
-try:
-    from PIL import Image  # noqa: F401
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
+from ._openai_client import get_openai_client
 
-try:
-    from openai import OpenAI
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
+# Check dependencies without importing them; the heavy modules are imported on first use
+PDFIUM_AVAILABLE = importlib.util.find_spec("pypdfium2") is not None
+PDF2IMAGE_AVAILABLE = importlib.util.find_spec("pdf2image") is not None
+QRCODE_AVAILABLE = importlib.util.find_spec("qrcode") is not None
+PIL_AVAILABLE = importlib.util.find_spec("PIL") is not None
+OPENAI_AVAILABLE = importlib.util.find_spec("openai") is not None
 
 try:
     from dotenv import load_dotenv
@@ -63,6 +49,24 @@ API_KEY = os.getenv("ARXIV_JUDGE_API_KEY")
 MAX_TOKENS = int(os.getenv("ARXIV_JUDGE_MAX_TOKENS") or "8000")
 TIMEOUT = int(os.getenv("ARXIV_JUDGE_TIMEOUT") or "1000")
 
+# First flat {...} block in the VLM reply ([^}] already spans newlines)
+_JSON_OBJ_RE = re.compile(r'\{[^}]+\}')
+# Trailing arXiv version suffix, e.g. the "v2" in 2301.12345v2
+_VERSION_SUFFIX_RE = re.compile(r'v\d+$')
+
+# The arXiv stamp is large vertical text in the left margin, so a low-DPI
+# render of the left quarter of the page is enough for the VLM to read it
+_RENDER_DPI = 120
+_ARXIV_STRIP_FRACTION = 0.25
+_JPEG_QUALITY = 85
+
+# Extracted arXiv links are memoized per PDF content so repeat runs skip rasterizing and the VLM call
+_CACHE_DIR = os.path.join(
+    os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "paper2poster",
+    "qr"
+)
+
 
 def gen_qr_code_tool(
     pdf_path: str,
@@ -93,8 +97,8 @@ def gen_qr_code_tool(
     """
     # Check dependencies
     missing_deps = []
-    if not PDF2IMAGE_AVAILABLE:
-        missing_deps.append("pdf2image")
+    if not (PDFIUM_AVAILABLE or PDF2IMAGE_AVAILABLE):
+        missing_deps.append("pypdfium2")
     if not QRCODE_AVAILABLE:
         missing_deps.append("qrcode")
     if not PIL_AVAILABLE:
@@ -128,23 +132,37 @@ def gen_qr_code_tool(
             # User provided path, convert to absolute path
             output_path = os.path.abspath(output_path)
 
-        # Step 1: Extract PDF first page as image
-        first_page_image = _extract_first_page(pdf_path)
+        cache_key = _cache_key(pdf_path)
+        cached = _load_cached_link(cache_key)
 
-        # Step 2: Use AI model to analyze image and extract arXiv link
-        arxiv_info = _extract_arxiv_link(first_page_image, api_key, api_base, output_path)
+        if cached:
+            arxiv_id = cached["arxiv_id"]
+            abs_link = cached["abs_link"]
+        else:
+            # Step 1: Extract the left margin of the PDF first page as image
+            margin_image = _extract_first_page(pdf_path)
 
-        if arxiv_info["status"] == "error":
-            return arxiv_info
+            # Step 2: Use AI model to analyze image and extract arXiv link
+            arxiv_info = _extract_arxiv_link(margin_image, api_key, api_base, output_path)
 
-        arxiv_id = arxiv_info["arxiv_id"]
-        abs_link = arxiv_info["abs_link"]
+            if arxiv_info["status"] == "error":
+                return arxiv_info
 
-        # Step 3: Generate QR code
-        qr_result = _generate_qr_code(abs_link, output_path)
+            arxiv_id = arxiv_info["arxiv_id"]
+            abs_link = arxiv_info["abs_link"]
 
-        if qr_result["status"] == "error":
-            return qr_result
+        # Step 3: Generate QR code (unless this exact QR code is already on disk)
+        if not (cached and cached.get("qr_code_path") == output_path and os.path.exists(output_path)):
+            qr_result = _generate_qr_code(abs_link, output_path)
+
+            if qr_result["status"] == "error":
+                return qr_result
+
+            _store_cached_link(cache_key, {
+                "arxiv_id": arxiv_id,
+                "abs_link": abs_link,
+                "qr_code_path": output_path
+            })
 
         return {
             "status": "success",
@@ -162,17 +180,67 @@ def gen_qr_code_tool(
         }
 
 
+def _cache_key(pdf_path: str) -> str:
+    """SHA-256 of the PDF contents"""
+    with open(pdf_path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def _load_cached_link(cache_key: str) -> Optional[Dict[str, Any]]:
+    """Return the memoized arXiv link for a PDF hash, or None"""
+    try:
+        with open(os.path.join(_CACHE_DIR, f"{cache_key}.json"), "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or not cached.get("arxiv_id") or not cached.get("abs_link"):
+        return None
+    return cached
+
+
+def _store_cached_link(cache_key: str, entry: Dict[str, Any]) -> None:
+    """Memoize an extracted arXiv link; the cache is best-effort, so write failures are ignored"""
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        path = os.path.join(_CACHE_DIR, f"{cache_key}.json")
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
 def _extract_first_page(pdf_path: str) -> Any:
-    """Extract PDF first page as image"""
+    """Extract the left margin strip of the PDF first page as image"""
     try:
-        # Only convert first page, set high DPI for clear image
+        if PDFIUM_AVAILABLE:
+            import pypdfium2 as pdfium
+
+            # Rasterize only the strip; crop is the amount cut from (left, bottom, right, top) in PDF points
+            pdf = pdfium.PdfDocument(pdf_path)
+            try:
+                page = pdf[0]
+                width = page.get_width()
+                bitmap = page.render(
+                    scale=_RENDER_DPI / 72,
+                    crop=(0, 0, width * (1 - _ARXIV_STRIP_FRACTION), 0)
+                )
+                return bitmap.to_pil()
+            finally:
+                pdf.close()
+
+        # Fallback: poppler renders the whole first page, then keep the strip
+        from pdf2image import convert_from_path
+
         images = convert_from_path(
             pdf_path,
             first_page=1,
             last_page=1,
-            dpi=200
+            dpi=_RENDER_DPI
         )
-        return images[0]
+        image = images[0]
+        return image.crop((0, 0, int(image.width * _ARXIV_STRIP_FRACTION), image.height))
     except Exception as e:
         raise Exception(f"PDF page extraction failed: {str(e)}")
 
@@ -185,19 +253,18 @@ def _extract_arxiv_link(
 ) -> Dict[str, Any]:
     """Use AI model to analyze image and extract arXiv link"""
     try:
-        # Convert image to base64 encoding
+        # Encode as JPEG (much smaller and faster than PNG)
+        if image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
         buffered = BytesIO()
-        image.save(buffered, format="PNG")
+        image.save(buffered, format="JPEG", quality=_JPEG_QUALITY)
         img_base64 = base64.b64encode(buffered.getvalue()).decode()
 
-        # Initialize OpenAI client
-        client = OpenAI(
-            base_url=api_base or BASE_URL,
-            api_key=api_key or API_KEY
-        )
+        # Get (cached) OpenAI client
+        client = get_openai_client(api_base or BASE_URL, api_key or API_KEY)
 
         # Build prompt
-        prompt = """Please analyze this screenshot of a PDF first page and determine if it is an arXiv paper.
+        prompt = """Please analyze this screenshot of the left margin of a PDF first page and determine if it is an arXiv paper.
 If it is an arXiv paper, please extract the arXiv ID (format like: 2301.12345).
 
 arXiv papers usually contain the following format information on the left side of the first page:
@@ -223,7 +290,7 @@ If it is not an arXiv paper or the arXiv ID cannot be identified, please set is_
                         {
                             "type": "image_url",
                             "image_url": {
-                                "url": f"data:image/png;base64,{img_base64}"
+                                "url": f"data:image/jpeg;base64,{img_base64}"
                             }
                         }
                     ]
@@ -237,7 +304,7 @@ If it is not an arXiv paper or the arXiv ID cannot be identified, please set is_
         result_text = response.choices[0].message.content.strip()
 
         # Try to find JSON block
-        json_match = re.search(r'\{[^}]+\}', result_text, re.DOTALL)
+        json_match = _JSON_OBJ_RE.search(result_text)
         if json_match:
             result_json = json.loads(json_match.group())
         else:
@@ -257,7 +324,7 @@ If it is not an arXiv paper or the arXiv ID cannot be identified, please set is_
             }
 
         # Clean arXiv ID (remove version number, etc.)
-        arxiv_id = re.sub(r'v\d+$', '', arxiv_id)
+        arxiv_id = _VERSION_SUFFIX_RE.sub('', arxiv_id)
 
         # Generate abs link
         abs_link = f"https://arxiv.org/abs/{arxiv_id}"
@@ -290,18 +357,27 @@ If it is not an arXiv paper or the arXiv ID cannot be identified, please set is_
 def _generate_qr_code(url: str, output_path: str) -> Dict[str, Any]:
     """Generate QR code"""
     try:
+        import qrcode
+        from PIL import Image
+
         # Create QR code
+        box_size = 10
         qr = qrcode.QRCode(
-            version=1,  # Auto adjust size
+            version=None,  # Chosen by make(fit=True)
             error_correction=qrcode.constants.ERROR_CORRECT_L,
-            box_size=10,
+            box_size=box_size,
             border=4,
         )
         qr.add_data(url)
         qr.make(fit=True)
 
-        # Generate image
-        img = qr.make_image(fill_color="black", back_color="white")
+        # Generate a 1-bit image straight from the module matrix (border included) and scale it up,
+        # instead of drawing every module as a separate rectangle
+        matrix = qr.get_matrix()
+        size = len(matrix)
+        img = Image.new("1", (size, size))
+        img.putdata([0 if module else 255 for row in matrix for module in row])
+        img = img.resize((size * box_size, size * box_size), Image.NEAREST)
 
         # Save image
         img.save(output_path)
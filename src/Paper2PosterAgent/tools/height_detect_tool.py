@@ -18,14 +18,17 @@ Detects the height of three columns in HTML poster and determines if they are ba
 """
 
 import os
+import atexit
 import asyncio
-import statistics
-from typing import Dict, Any, Optional
-from collections import defaultdict
+import bisect
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 
 # Check dependencies
 try:
-    from playwright.async_api import async_playwright
+    from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
     PLAYWRIGHT_AVAILABLE = True
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
@@ -34,42 +37,235 @@ except ImportError:
 # Configuration
 AVAILABLE_HEIGHT_PER_COLUMN = 1000
 
+# Extra Chromium switches for layout-only measurement. Playwright already disables
+# extensions, sync, background networking and the sandbox; images stay enabled
+# because their rendered height is part of each column's height.
+_CHROMIUM_ARGS = [
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+]
+
+# Column heights depend on images and web fonts, so measurement waits for the load
+# event, but at most this long: a slow external resource should delay the result,
+# not fail it with goto's 30s navigation timeout
+_LOAD_TIMEOUT_MS = 5000
+
+# (html path, content hash) -> column heights, only for pages whose load event fired;
+# oldest entries are evicted past _DETECT_CACHE_SIZE
+_DETECT_CACHE: Dict[Tuple[str, bytes], Optional[List[float]]] = {}
+_DETECT_CACHE_LOCK = threading.Lock()
+_DETECT_CACHE_SIZE = 128
+
+# Column status by height utilization (%): bisect_right over the bounds picks the
+# (status, suggestion) row, i.e. <60, <75, <90, <100, and everything above
+_COLUMN_STATUS_BOUNDS = (60, 75, 90, 100)
+_COLUMN_STATUS_TABLE = (
+    ("❌ Space utilization too low",
+     "{remaining:.0f}px space remaining, suggest adding content:\n  - Move content from other columns (e.g., images, conclusion paragraphs)\n  - Add more experimental results or case studies\n  - Add visualization charts or example images"),
+    ("⚠ Insufficient space utilization",
+     "{remaining:.0f}px space remaining, suggest adding:\n  - Move some content from highest column\n  - Add related work or background introduction\n  - Expand detailed description of existing sections"),
+    ("✓ Good space utilization",
+     "{remaining:.0f}px space remaining, basically reasonable, can fine-tune:\n  - Can receive content if other columns are too full\n  - Maintain current content density"),
+    ("⚠ Space near saturation",
+     "Only {remaining:.0f}px space remaining, suggest:\n  - Consider moving some content to columns with more space\n  - Streamline current content, keep core information\n  - Check for redundant content that can be removed"),
+    ("❌ Space overloaded",
+     "Exceeded available space by {overflow:.0f}px, must adjust:\n  - Move some content to other columns\n  - Remove secondary content or reduce font size\n  - Compress image sizes or reduce number of images"),
+)
+
+# Mandatory actions once the height difference exceeds 5%: bisect_left over the
+# bounds picks the row for <=10, <=20, <=30 and >30 percent
+_IMBALANCE_BOUNDS = (10, 20, 30)
+_IMBALANCE_ACTIONS = (
+    ("⚠️ **Adjustment required**: Move small text or slightly adjust image size",
+     "⚠️ **Specific action**: Adjust image height in Column {max_col} to reduce {move_amount:.0f}px, or move small amount of text to Column {min_col}"),
+    ("‼️ **Mandatory**: Must move at least 1 paragraph or adjust image size",
+     "‼️ **Specific action**: Reduce image in Column {max_col} or move a text paragraph to Column {min_col}"),
+    ("‼️ **Mandatory**: Must move 1-2 complete paragraphs or one medium-sized image",
+     "‼️ **Specific action**: Select content block of approximately {move_amount:.0f}px from Column {max_col} and move to Column {min_col}"),
+    ("‼️ **Mandatory**: Must move entire sections (e.g., Methods, Results, Related Work, etc.)",
+     "‼️ **Specific action**: Reorganize three-column content distribution, move at least 1 complete section from highest column to lowest column"),
+)
+
+
+class _BrowserSingleton:
+    """
+    Headless Chromium shared by all height detections
+    Playwright's async objects belong to the event loop that created them, so the
+    browser lives on a dedicated loop thread and each call only opens a new context
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._launch_lock = asyncio.Lock()
+        self._playwright = None
+        self._browser = None
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, name="height-detect-browser", daemon=True).start()
+                atexit.register(self.close)
+            return self._loop
+
+    async def _get_browser(self):
+        # Only ever runs on the browser loop; the asyncio lock keeps concurrent first calls from launching twice
+        async with self._launch_lock:
+            if self._browser is None or not self._browser.is_connected():
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(headless=True, args=_CHROMIUM_ARGS)
+            return self._browser
+
+    def run(self, func, *args):
+        """Run the coroutine function func(browser, *args) on the browser loop and return its result"""
+        async def call():
+            return await func(await self._get_browser(), *args)
+
+        return asyncio.run_coroutine_threadsafe(call(), self._ensure_loop()).result()
+
+    async def _shutdown(self) -> None:
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    def close(self) -> None:
+        """Close the browser and stop the loop thread (registered with atexit)"""
+        with self._lock:
+            loop, self._loop = self._loop, None
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result(timeout=10)
+        except Exception:
+            pass
+        loop.call_soon_threadsafe(loop.stop)
+
+
+_BROWSER = _BrowserSingleton()
+
+# Column detection, run entirely in the page in one evaluate call. Returns the three
+# column heights ordered by x, or null if no three-column structure is found.
+#   Strategy 1: exactly three .column-like elements, measured by their sections
+#   Strategy 2: group sizeable divs by width, look for a width (200-800px) whose divs
+#   cluster into exactly 3 x positions, then measure each column at its mean x
+_DETECT_COLUMNS_JS = """
+() => {
+    // Actual content height of a column container: its sections plus the gaps between them
+    const contentHeight = col => {
+        const sections = col.querySelectorAll('.section');
+        let height = 0;
+        sections.forEach(section => {
+            height += section.scrollHeight;
+        });
+        const gap = parseFloat(window.getComputedStyle(col).gap) || 25; // Default 25px
+        return height + (sections.length - 1) * gap;
+    };
+
+    // Strategy 1: look for .column class elements first
+    const cols = document.querySelectorAll('div.column, div[class*="column"], div[class*="col-"], div[class~="col"]');
+    if (cols.length === 3) {
+        return [...cols]
+            .map(col => ({x: col.getBoundingClientRect().left, height: contentHeight(col)}))
+            .sort((a, b) => a.x - b.x)
+            .map(col => col.height);
+    }
+
+    // Strategy 2: width grouping, scoped to the poster container when there is one
+    const root = document.querySelector('.poster, #poster, main') || document.body;
+    const allDivs = [...root.querySelectorAll('div')];
+    const mean = list => list.reduce((sum, d) => sum + d.x, 0) / list.length;
+
+    // Group divs with reasonable width and height by width
+    const groups = new Map();
+    for (const div of allDivs) {
+        const rect = div.getBoundingClientRect();
+        const d = {x: rect.left, width: rect.width, height: div.scrollHeight};
+        if (d.width <= 50 || d.height <= 50) continue;
+        // Hidden divs still occupy layout space but are not visible columns
+        if (window.getComputedStyle(div).visibility === 'hidden') continue;
+        const key = Math.round(d.width * 10) / 10;
+        if (!groups.has(key)) groups.set(key, []);
+        groups.get(key).push(d);
+    }
+
+    // Look for width groups that can be divided into 3 columns
+    let columns = null;
+    for (const [width, lst] of groups) {
+        if (lst.length < 3) continue;
+        lst.sort((a, b) => a.x - b.x);
+
+        // Running x sum of the current column, so each comparison against its mean is O(1)
+        const tempColumns = [];
+        let currentCol = [lst[0]];
+        let currentSum = lst[0].x;
+        for (const d of lst.slice(1)) {
+            if (Math.abs(d.x - currentSum / currentCol.length) < 10) {
+                currentCol.push(d);
+                currentSum += d.x;
+            } else {
+                tempColumns.push(currentCol);
+                currentCol = [d];
+                currentSum = d.x;
+            }
+        }
+        tempColumns.push(currentCol);
+
+        if (tempColumns.length === 3 && width >= 200 && width <= 800) {
+            columns = tempColumns;
+            break;
+        }
+    }
+    if (!columns) return null;
 
-def _generate_suggestions(result: Dict[str, Any], available_height: int) -> Dict[str, Any]:
+    // Calculate actual content height for each column
+    return columns.map(mean).sort((a, b) => a - b).map(centerX => {
+        const nearby = allDivs.filter(d => Math.abs(d.getBoundingClientRect().left - centerX) < 50);
+
+        // Find the column container at this position
+        const columnDiv = nearby.find(d => d.classList.contains('column'));
+        if (columnDiv) {
+            return contentHeight(columnDiv);
+        }
+
+        // If .column container not found, fall back to finding max scrollHeight
+        return Math.max(...nearby.map(d => d.scrollHeight || 0));
+    });
+}
+"""
+
+
+def _generate_suggestions(heights_pct: List[float], available_height: int) -> Dict[str, Any]:
     """
     Generate detailed adjustment suggestions based on height detection results
 
     Args:
-        result: Height detection results
+        heights_pct: Height utilization of each column in percent (rounded to 0.1)
         available_height: Available height
 
     Returns:
         Dictionary containing detailed suggestions
     """
-    # Parse column height percentages
     col_heights = {}
     col_pixels = {}
-    for i in range(1, 4):
-        col_key = f"column_{i}"
-        height_str = result.get(col_key, "0%")
-        # Parse percentage
-        height_percent = float(height_str.rstrip('%'))
+    for i, height_percent in enumerate(heights_pct, 1):
         col_heights[i] = height_percent
         col_pixels[i] = (height_percent / 100) * available_height
 
-    # Find highest and lowest columns
-    max_col = max(col_heights, key=col_heights.get)
-    min_col = min(col_heights, key=col_heights.get)
-    max_height = col_heights[max_col]
-    min_height = col_heights[min_col]
+    # Order columns from lowest to highest
+    ordered = sorted(col_heights.items(), key=lambda item: item[1])
+    min_col, min_height = ordered[0]
+    middle_col, middle_height = ordered[1]
+    max_col, max_height = ordered[-1]
 
     # Calculate difference
     height_diff_percent = max_height - min_height
     height_diff_px = col_pixels[max_col] - col_pixels[min_col]
 
-    # Determine balance status
-    is_balanced = result.get("is_balanced", False)
-
     # Generate suggestions
     suggestions = {
         "overall_status": "",
@@ -93,31 +289,15 @@ def _generate_suggestions(result: Dict[str, Any], available_height: int) -> Dict
         pixels = col_pixels[i]
         remaining = available_height - pixels
 
+        status, suggestion = _COLUMN_STATUS_TABLE[bisect.bisect_right(_COLUMN_STATUS_BOUNDS, height)]
         analysis = {
             "height_usage": f"{height:.1f}%",
             "pixels_used": f"{pixels:.0f}px",
             "remaining_space": f"{remaining:.0f}px",
-            "status": "",
-            "suggestion": ""
+            "status": status,
+            "suggestion": suggestion.format(remaining=remaining, overflow=pixels - available_height)
         }
 
-        # Determine column status
-        if height < 60:
-            analysis["status"] = "❌ Space utilization too low"
-            analysis["suggestion"] = f"{remaining:.0f}px space remaining, suggest adding content:\n  - Move content from other columns (e.g., images, conclusion paragraphs)\n  - Add more experimental results or case studies\n  - Add visualization charts or example images"
-        elif height < 75:
-            analysis["status"] = "⚠ Insufficient space utilization"
-            analysis["suggestion"] = f"{remaining:.0f}px space remaining, suggest adding:\n  - Move some content from highest column\n  - Add related work or background introduction\n  - Expand detailed description of existing sections"
-        elif height < 90:
-            analysis["status"] = "✓ Good space utilization"
-            analysis["suggestion"] = f"{remaining:.0f}px space remaining, basically reasonable, can fine-tune:\n  - Can receive content if other columns are too full\n  - Maintain current content density"
-        elif height < 100:
-            analysis["status"] = "⚠ Space near saturation"
-            analysis["suggestion"] = f"Only {remaining:.0f}px space remaining, suggest:\n  - Consider moving some content to columns with more space\n  - Streamline current content, keep core information\n  - Check for redundant content that can be removed"
-        else:
-            analysis["status"] = "❌ Space overloaded"
-            analysis["suggestion"] = f"Exceeded available space by {pixels - available_height:.0f}px, must adjust:\n  - Move some content to other columns\n  - Remove secondary content or reduce font size\n  - Compress image sizes or reduce number of images"
-
         suggestions["column_analysis"][col_name] = analysis
 
     # Recommended actions (5% mandatory threshold)
@@ -136,33 +316,9 @@ def _generate_suggestions(result: Dict[str, Any], available_height: int) -> Dict
         )
 
         # Specific content requirements
-        if height_diff_percent > 30:
+        for template in _IMBALANCE_ACTIONS[bisect.bisect_left(_IMBALANCE_BOUNDS, height_diff_percent)]:
             suggestions["recommended_actions"].append(
-                "‼️ **Mandatory**: Must move entire sections (e.g., Methods, Results, Related Work, etc.)"
-            )
-            suggestions["recommended_actions"].append(
-                f"‼️ **Specific action**: Reorganize three-column content distribution, move at least 1 complete section from highest column to lowest column"
-            )
-        elif height_diff_percent > 20:
-            suggestions["recommended_actions"].append(
-                "‼️ **Mandatory**: Must move 1-2 complete paragraphs or one medium-sized image"
-            )
-            suggestions["recommended_actions"].append(
-                f"‼️ **Specific action**: Select content block of approximately {move_amount:.0f}px from Column {max_col} and move to Column {min_col}"
-            )
-        elif height_diff_percent > 10:
-            suggestions["recommended_actions"].append(
-                "‼️ **Mandatory**: Must move at least 1 paragraph or adjust image size"
-            )
-            suggestions["recommended_actions"].append(
-                f"‼️ **Specific action**: Reduce image in Column {max_col} or move a text paragraph to Column {min_col}"
-            )
-        else:  # 5% < diff <= 10%
-            suggestions["recommended_actions"].append(
-                "⚠️ **Adjustment required**: Move small text or slightly adjust image size"
-            )
-            suggestions["recommended_actions"].append(
-                f"⚠️ **Specific action**: Adjust image height in Column {max_col} to reduce {move_amount:.0f}px, or move small amount of text to Column {min_col}"
+                template.format(move_amount=move_amount, max_col=max_col, min_col=min_col)
             )
     elif height_diff_percent > 0:
         # 0-5%: Minor suggestion
@@ -181,8 +337,6 @@ def _generate_suggestions(result: Dict[str, Any], available_height: int) -> Dict
         balance_tips.append("🔴 **Serious issue**: Lowest column utilization too low (<65%), must add substantial content!")
 
     # Middle column suggestion
-    middle_col = 6 - max_col - min_col  # 1+2+3=6
-    middle_height = col_heights[middle_col]
     if 75 <= middle_height <= 85:
         balance_tips.append(f"✓ Column {middle_col} height moderate ({middle_height:.1f}%), can serve as buffer zone for balance adjustment")
 
@@ -267,30 +421,35 @@ def height_detect_tool(
         # Convert to absolute path
         html_path = os.path.abspath(html_path)
 
-        # Execute height detection
-        result = asyncio.run(_detect_columns(html_path, available_height))
+        # Execute height detection (memoized per file content)
+        with open(html_path, "rb") as f:
+            content_hash = hashlib.blake2b(f.read(), digest_size=16).digest()
+        col_heights = _detect_cached(html_path, content_hash)
 
-        if result is None:
+        if col_heights is None:
             return {
                 "status": "error",
                 "error": "Three-column structure not detected"
             }
 
+        # Calculate balance
+        max_height = max(col_heights)
+        min_height = min(col_heights)
+        height_diff = max_height - min_height
+        height_diff_percent = (height_diff / available_height) * 100
+        heights_pct = [round(100 * h / available_height, 1) for h in col_heights]
+
         # Generate detailed suggestions
-        suggestions = _generate_suggestions(result, available_height)
+        suggestions = _generate_suggestions(heights_pct, available_height)
 
         return {
             "status": "success",
             "message": "Three-column height detection completed",
-            "column_heights": {
-                "column_1": result.get("column_1", "0%"),
-                "column_2": result.get("column_2", "0%"),
-                "column_3": result.get("column_3", "0%")
-            },
-            "is_balanced": result.get("is_balanced", False),
-            "max_height": result.get("max_height", "0px"),
-            "min_height": result.get("min_height", "0px"),
-            "height_diff": result.get("height_diff", "0px (0%)"),
+            "column_heights": {f"column_{i}": f"{pct:.1f}%" for i, pct in enumerate(heights_pct, 1)},
+            "is_balanced": height_diff <= available_height * 0.2,
+            "max_height": f"{max_height}px",
+            "min_height": f"{min_height}px",
+            "height_diff": f"{height_diff}px ({height_diff_percent:.1f}%)",
             "suggestions": suggestions,
             "html_path": html_path
         }
@@ -306,184 +465,116 @@ def height_detect_tool(
         }
 
 
+def height_detect_tool_batch(
+    html_paths: List[str],
+    available_height: int = AVAILABLE_HEIGHT_PER_COLUMN,
+    concurrency: int = 8
+) -> Dict[str, Any]:
+    """
+    Detect three-column heights for multiple HTML posters concurrently.
+
+    Each file is measured by height_detect_tool in its own browser context on the
+    shared Chromium; the worker threads only wait on the browser loop, which loads
+    up to `concurrency` pages at the same time.
+
+    Args:
+        html_paths: List of HTML file paths
+        available_height: Available height per column (pixels, default 1000px)
+        concurrency: Maximum number of files measured at the same time (default 8)
+
+    Returns:
+        Dict[str, Any]: Contains the following fields:
+            - status: "success" or "error"
+            - message: Operation result description
+            - results: height_detect_tool result for each input, in input order (on success)
+            - total: Total count (on success)
+            - success_count: Success count (on success)
+            - failed_count: Failure count (on success)
+            - error: Error message (on failure)
+    """
+    if not PLAYWRIGHT_AVAILABLE:
+        return {
+            "status": "error",
+            "error": "Missing dependency: playwright. Please install using: pip install playwright && playwright install"
+        }
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            results = list(executor.map(lambda path: height_detect_tool(path, available_height), html_paths))
+
+        success_count = sum(1 for result in results if result["status"] == "success")
+
+        return {
+            "status": "success",
+            "message": f"Batch height detection completed, successful: {success_count}/{len(html_paths)}",
+            "results": results,
+            "total": len(html_paths),
+            "success_count": success_count,
+            "failed_count": len(html_paths) - success_count
+        }
+    except Exception as e:
+        return {
+            "status": "error",
+            "error": f"Batch height detection failed: {str(e)}"
+        }
+
+
+def _detect_cached(html_path: str, content_hash: bytes) -> Optional[List[float]]:
+    """
+    Run _detect_columns on the shared browser, memoized on the HTML content
+
+    Layout tuning re-checks the same file many times; an unchanged file (same path,
+    since relative assets resolve against it, and same bytes) returns the cached
+    result. Measurements taken after the load timeout may miss images and fonts,
+    so they are returned but not cached, and the next call measures again.
+    The result is shared between calls and must not be mutated.
+    """
+    key = (html_path, content_hash)
+    with _DETECT_CACHE_LOCK:
+        if key in _DETECT_CACHE:
+            return _DETECT_CACHE[key]
+
+    col_heights, loaded = _BROWSER.run(_detect_columns, html_path)
+    if loaded:
+        with _DETECT_CACHE_LOCK:
+            _DETECT_CACHE[key] = col_heights
+            if len(_DETECT_CACHE) > _DETECT_CACHE_SIZE:
+                del _DETECT_CACHE[next(iter(_DETECT_CACHE))]
+    return col_heights
+
+
 async def _detect_columns(
-    html_path: str,
-    available_height: int = AVAILABLE_HEIGHT_PER_COLUMN
-) -> Optional[Dict[str, Any]]:
+    browser: Any,
+    html_path: str
+) -> Tuple[Optional[List[float]], bool]:
     """
     Three-column detection script (improved version)
     Input: HTML file absolute path
-    Output: Visual content height of each of the three columns
+    Output: Visual content height (px) of each of the three columns, ordered left to right
+            (None if not detected), and whether the page's load event fired before measuring
 
     Detection strategy:
     1. Priority: Look for .column class elements (most direct)
     2. If not found, try width grouping to find groups that can be divided into 3 columns
     """
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        page = await browser.new_page()
-        await page.goto(f"file://{html_path}")
-
-        # 策略1: 优先查找 .column 类的元素，并计算实际内容高度
-        column_data = await page.evaluate("""
-        () => {
-            const cols = document.querySelectorAll('div.column, div[class*="column"], div[class*="col-"], div[class~="col"]');
-            if (cols.length === 3) {
-                return [...cols].map(col => {
-                    const rect = col.getBoundingClientRect();
-                    const sections = col.querySelectorAll('.section');
-
-                    // Calculate actual content height
-                    let contentHeight = 0;
-                    sections.forEach(section => {
-                        contentHeight += section.scrollHeight;
-                    });
-
-                    // Get gap value (from computed style)
-                    const computedStyle = window.getComputedStyle(col);
-                    const gap = parseFloat(computedStyle.gap) || 25; // Default 25px
-
-                    // Add gap
-                    const totalGap = (sections.length - 1) * gap;
-                    const actualHeight = contentHeight + totalGap;
-
-                    return {
-                        x: rect.left,
-                        y: rect.top,
-                        width: rect.width,
-                        containerHeight: col.scrollHeight,
-                        actualHeight: actualHeight,
-                        sectionsCount: sections.length,
-                        className: col.className
-                    };
-                });
-            }
-            return null;
-        }
-        """)
-
-        col_heights = []
-
-        if column_data and len(column_data) == 3:
-            # Found clear three-column structure
-            column_data.sort(key=lambda d: d["x"])
-            col_heights = [d["actualHeight"] for d in column_data]
-        else:
-            # Strategy 2: Use width grouping method
-            divs = await page.evaluate("""
-            () => {
-                return [...document.querySelectorAll('div')].map((div, i) => {
-                    const rect = div.getBoundingClientRect();
-                    return {
-                        i,
-                        className: div.className,
-                        x: rect.left,
-                        y: rect.top,
-                        width: rect.width,
-                        height: div.scrollHeight
-                    };
-                });
-            }
-            """)
-
-            # Filter: both width and height should be reasonable
-            divs = [d for d in divs if d["width"] > 50 and d["height"] > 50]
-
-            # Group by width
-            groups = defaultdict(list)
-            for d in divs:
-                groups[round(d["width"], 1)].append(d)
-
-            # Look for width groups that can be divided into 3 columns
-            best_group = None
-            for width, lst in groups.items():
-                if len(lst) < 3:
-                    continue
-
-                # Sort by x coordinate
-                lst.sort(key=lambda d: d["x"])
-
-                # Try to divide into columns
-                temp_columns = []
-                current_col = [lst[0]]
-                for d in lst[1:]:
-                    if abs(d["x"] - statistics.mean([x["x"] for x in current_col])) < 10:
-                        current_col.append(d)
-                    else:
-                        temp_columns.append(current_col)
-                        current_col = [d]
-                temp_columns.append(current_col)
-
-                # If exactly 3 columns and width in reasonable range (200-800px)
-                if len(temp_columns) == 3 and 200 <= width <= 800:
-                    best_group = (width, temp_columns)
-                    break
-
-            if not best_group:
-                await browser.close()
-                return None
-
-            _, columns = best_group
-            columns = sorted(columns, key=lambda c: statistics.mean([x["x"] for x in c]))
-
-            # Calculate actual content height for each column
-            for col in columns:
-                center_x = statistics.mean([d["x"] for d in col])
-                actual_h = await page.evaluate(f"""
-                () => {{
-                    const divs = [...document.querySelectorAll('div')];
-                    // Find the column container at this position
-                    const columnDiv = divs.find(d => {{
-                        const r = d.getBoundingClientRect();
-                        return Math.abs(r.left - {center_x}) < 50 && d.classList.contains('column');
-                    }});
-
-                    if (columnDiv) {{
-                        const sections = columnDiv.querySelectorAll('.section');
-                        let contentHeight = 0;
-                        sections.forEach(section => {{
-                            contentHeight += section.scrollHeight;
-                        }});
-
-                        const computedStyle = window.getComputedStyle(columnDiv);
-                        const gap = parseFloat(computedStyle.gap) || 25;
-                        const totalGap = (sections.length - 1) * gap;
-
-                        return contentHeight + totalGap;
-                    }}
-
-                    // If .column container not found, fall back to finding max scrollHeight
-                    const targetDivs = divs.filter(d => {{
-                        const r = d.getBoundingClientRect();
-                        return Math.abs(r.left - {center_x}) < 50;
-                    }});
-                    return Math.max(...targetDivs.map(d => d.scrollHeight || 0));
-                }}
-                """)
-                col_heights.append(actual_h)
-
-        # Verify results
-        if len(col_heights) != 3:
-            await browser.close()
-            return None
-
-        # Calculate balance
-        max_height = max(col_heights)
-        min_height = min(col_heights)
-        height_diff = max_height - min_height
-        height_diff_percent = (height_diff / available_height) * 100
-        is_balanced = height_diff <= available_height * 0.2
-
-        await browser.close()
+    # A fresh context per call keeps pages isolated; only the context is closed afterwards
+    context = await browser.new_context()
+    try:
+        page = await context.new_page()
+        await page.goto(f"file://{html_path}", wait_until="domcontentloaded")
+        loaded = True
+        try:
+            await page.wait_for_load_state("load", timeout=_LOAD_TIMEOUT_MS)
+        except PlaywrightTimeoutError:
+            loaded = False
 
-        # Build results
-        col_height_dict = {}
-        for i, h in enumerate(col_heights, 1):
-            col_height_dict[f"column_{i}"] = f"{100*h/available_height:.1f}%"
+        # Both detection strategies run in the page in a single round trip
+        col_heights = await page.evaluate(_DETECT_COLUMNS_JS)
 
-        col_height_dict["is_balanced"] = is_balanced
-        col_height_dict["max_height"] = f"{max_height}px"
-        col_height_dict["min_height"] = f"{min_height}px"
-        col_height_dict["height_diff"] = f"{height_diff}px ({height_diff_percent:.1f}%)"
+        # Verify results
+        if not col_heights or len(col_heights) != 3:
+            return None, loaded
 
-        return col_height_dict
+        return col_heights, loaded
+    finally:
+        await context.close()
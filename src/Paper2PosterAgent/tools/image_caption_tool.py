@@ -21,22 +21,28 @@ import re
 import os
 import json
 import base64
+import asyncio
+import struct
+import hashlib
+import threading
+import importlib.util
+from html import escape
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple, Any
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import quote
+from typing import TYPE_CHECKING, List, Dict, Optional, Tuple, Any, Coroutine
+from concurrent.futures import ThreadPoolExecutor
 
-# Check dependencies
-try:
-    from PIL import Image
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
+if TYPE_CHECKING:
+    import httpx
+
+# Check dependencies without importing them; PIL and httpx are imported on first use
+PIL_AVAILABLE = importlib.util.find_spec("PIL") is not None
+HTTPX_AVAILABLE = importlib.util.find_spec("httpx") is not None
 
 try:
-    import requests
-    REQUESTS_AVAILABLE = True
+    from orjson import loads as _json_loads
 except ImportError:
-    REQUESTS_AVAILABLE = False
+    _json_loads = json.loads
 
 try:
     from dotenv import load_dotenv
@@ -68,6 +74,8 @@ SECTION_KEYWORDS = {
 # Reference section keywords
 REFERENCE_KEYWORDS = ['reference', 'references', '参考文献', 'bibliography']
 
+_REFERENCE_PREFIXES = tuple(REFERENCE_KEYWORDS)
+
 # VLM caption generation prompt
 VLM_CAPTION_PROMPT = """Please generate a concise Chinese title and detailed description for this image from an academic paper.
 
@@ -85,12 +93,94 @@ Please return in the following JSON format:
 }}
 """
 
+# Markdown image reference, heading marker and fenced JSON in VLM answers
+_IMAGE_RE = re.compile(r'!\[.*?\]\((.*?)\)')
+_HEADER_PREFIX_RE = re.compile(r'^#+\s*')
+_JSON_BLOCK_RE = re.compile(r'```json\s*(\{.*?\})\s*```', re.DOTALL)
+
+# Heading or image reference, so each markdown line needs a single scan
+_STRUCTURAL_RE = re.compile(r'^\s*(?P<heading>#)|!\[.*?\]\((?P<image>.*?)\)')
+
+# All section keywords in one pattern, anchored at the start of the title with one
+# lookahead per section type: alternatives are tried in SECTION_KEYWORDS priority
+# order, so the named group that matches is the highest-priority section present
+_SECTION_RE = re.compile('|'.join(
+    f"(?P<{section_type}>(?=.*?(?:{'|'.join(map(re.escape, keywords))})))"
+    for section_type, keywords in SECTION_KEYWORDS.items()
+), re.DOTALL)
+
+# HTML report templates (simplified version)
+_HTML_HEADER = """<!DOCTYPE html>
+<html lang="zh-CN">
+<head>
+    <meta charset="UTF-8">
+    <title>Image Caption Generation Results</title>
+    <style>
+        body {{ font-family: -apple-system, sans-serif; padding: 20px; background: #f5f5f5; }}
+        .container {{ max-width: 1400px; margin: 0 auto; background: white; border-radius: 10px; padding: 30px; }}
+        .header {{ text-align: center; margin-bottom: 30px; }}
+        .stats {{ display: flex; justify-content: space-around; margin-bottom: 30px; }}
+        .stat-item {{ text-align: center; }}
+        .stat-number {{ font-size: 2em; font-weight: bold; color: #667eea; }}
+        .image-grid {{ display: grid; grid-template-columns: repeat(auto-fill, minmax(450px, 1fr)); gap: 30px; }}
+        .image-card {{ border: 1px solid #ddd; border-radius: 10px; overflow: hidden; }}
+        .image-preview {{ width: 100%; height: 300px; object-fit: contain; padding: 10px; background: #f8f9fa; }}
+        .image-info {{ padding: 20px; }}
+        .generated-title {{ font-size: 1.2em; color: #667eea; font-weight: bold; margin-bottom: 10px; }}
+        .description {{ padding: 10px; background: #f8f9fa; border-radius: 5px; margin: 10px 0; }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>Image Caption Generation Results</h1>
+        </div>
+        <div class="stats">
+            <div class="stat-item"><div class="stat-number">{total}</div><div>Total Images</div></div>
+            <div class="stat-item"><div class="stat-number">{success}</div><div>Success</div></div>
+            <div class="stat-item"><div class="stat-number">{failed}</div><div>Failed</div></div>
+        </div>
+        <div class="image-grid">
+"""
+
+_HTML_CARD = """
+            <div class="image-card">
+                <img src="{src}" alt="Image {idx}" class="image-preview">
+                <div class="image-info">
+                    <div class="generated-title">{title}</div>
+                    {description}
+                    <div><strong>Path:</strong> {path}</div>
+                    <div><strong>Size:</strong> {pixel_size}</div>
+                    <div><strong>Section:</strong> {section}</div>
+                </div>
+            </div>
+"""
+
+_HTML_FOOTER = """
+        </div>
+    </div>
+</body>
+</html>
+"""
+
 # Default configuration
 DEFAULT_MAX_WORKERS = 5
 VLM_TIMEOUT = int(os.getenv("VLM_TIMEOUT") or "1000")
 VLM_MAX_TOKENS = int(os.getenv("VLM_MAX_TOKENS") or "6000")
 VLM_TEMPERATURE = float(os.getenv("VLM_TEMPERATURE") or "0.9")
 
+# How images are handed to the VLM: "base64" inlines them as data URLs, "file_url"
+# sends file:// URLs for endpoints that share this filesystem (e.g. a local vLLM
+# started with --allowed-local-media-path)
+VLM_IMAGE_MODE = (os.getenv("VLM_IMAGE_MODE") or "base64").lower()
+
+# Generated captions are memoized per (image contents, prompt, model)
+_CACHE_DIR = os.getenv("VLM_CAPTION_CACHE_DIR") or os.path.join(
+    os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "paper2poster",
+    "vlm_captions"
+)
+
 
 def image_caption_tool(
     md_file_path: str,
@@ -104,7 +194,7 @@ def image_caption_tool(
 
     Args:
         md_file_path: Markdown file path
-        max_workers: Maximum number of concurrent processing threads (default 5)
+        max_workers: Maximum number of concurrent VLM requests (default 5)
         output_json: Whether to output JSON file (default True)
         output_html: Whether to output HTML file (default True)
         **kwargs: Other parameters
@@ -122,12 +212,36 @@ def image_caption_tool(
             - images: Image information list (on success)
             - error: Error message (on failure)
     """
+    return _run_sync(image_caption_tool_async(
+        md_file_path,
+        max_workers=max_workers,
+        output_json=output_json,
+        output_html=output_html,
+        **kwargs
+    ))
+
+
+async def image_caption_tool_async(
+    md_file_path: str,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    output_json: bool = True,
+    output_html: bool = True,
+    client: Optional["httpx.AsyncClient"] = None,
+    **kwargs
+) -> Dict[str, Any]:
+    """
+    Async variant of image_caption_tool, returning the same result dict.
+
+    Batch pipelines can asyncio.gather it over many Markdown files and pass
+    one shared httpx.AsyncClient as client, so every paper's VLM requests
+    go through a single connection pool.
+    """
     # Check dependencies
     missing_deps = []
     if not PIL_AVAILABLE:
         missing_deps.append("Pillow")
-    if not REQUESTS_AVAILABLE:
-        missing_deps.append("requests")
+    if not HTTPX_AVAILABLE:
+        missing_deps.append("httpx")
 
     if missing_deps:
         return {
@@ -140,24 +254,25 @@ def image_caption_tool(
         generator = ImageCaptionGenerator(md_file_path, max_workers=max_workers)
 
         # Execute complete workflow
-        results = generator.process()
+        results = await generator.process_async(client)
 
         # Save results
         output_dir = Path(md_file_path).parent
-        output_dir.mkdir(exist_ok=True, parents=True)
+        if not output_dir.is_dir():
+            output_dir.mkdir(exist_ok=True, parents=True)
 
         output_files = {}
 
         # Save as JSON
         if output_json:
             json_output = output_dir / "image_captions.json"
-            generator.save_to_json(str(json_output))
+            await asyncio.to_thread(generator.save_to_json, str(json_output))
             output_files['json_path'] = str(json_output)
 
         # Save as HTML
         if output_html:
             html_output = output_dir / "image_captions.html"
-            generator.save_to_html(str(html_output))
+            await asyncio.to_thread(generator.save_to_html, str(html_output))
             output_files['html_path'] = str(html_output)
 
         # Statistics
@@ -188,85 +303,180 @@ def image_caption_tool(
         }
 
 
+def _run_sync(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run a coroutine to completion, on a helper thread if this thread already runs an event loop"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+def _caption_cache_key(image_digest: str, prompt: str) -> str:
+    """Cache key from the image SHA-256 and a hash of the prompt and model it is captioned with"""
+    request_digest = hashlib.sha256(f"{VLM_CONFIG['model']}\0{prompt}".encode('utf-8')).hexdigest()
+    return f"{image_digest}_{request_digest[:16]}"
+
+
+def _load_cached_caption(cache_key: str) -> Optional[Dict[str, str]]:
+    """Return the memoized caption for a cache key, or None"""
+    try:
+        with open(os.path.join(_CACHE_DIR, f"{cache_key}.json"), 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or 'title' not in cached or 'description' not in cached:
+        return None
+    return cached
+
+
+def _store_cached_caption(cache_key: str, caption: Dict[str, str]) -> None:
+    """Memoize a generated caption; the cache is best-effort, so write failures are ignored"""
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        path = os.path.join(_CACHE_DIR, f"{cache_key}.json")
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(caption, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def _read_image_header(path: str) -> Optional[Tuple[str, int, int]]:
+    """
+    Read the MIME type and pixel size of a PNG, GIF, WebP or JPEG from its
+    header bytes, without going through a PIL decoder. Returns None for other formats.
+    """
+    with open(path, 'rb') as f:
+        head = f.read(32)
+
+        if head[:8] == b'\x89PNG\r\n\x1a\n' and head[12:16] == b'IHDR':
+            return ('image/png', *struct.unpack('>II', head[16:24]))
+
+        if head[:6] in (b'GIF87a', b'GIF89a'):
+            return ('image/gif', *struct.unpack('<HH', head[6:10]))
+
+        if head[:4] == b'RIFF' and head[8:12] == b'WEBP' and len(head) >= 30:
+            chunk = head[12:16]
+            if chunk == b'VP8 ':
+                width, height = struct.unpack('<HH', head[26:30])
+                return 'image/webp', width & 0x3FFF, height & 0x3FFF
+            if chunk == b'VP8L':
+                bits = int.from_bytes(head[21:25], 'little')
+                return 'image/webp', (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+            if chunk == b'VP8X':
+                return 'image/webp', int.from_bytes(head[24:27], 'little') + 1, int.from_bytes(head[27:30], 'little') + 1
+            return None
+
+        if head[:2] == b'\xff\xd8':
+            # Walk the marker segments up to the first SOF, whose header holds height and width
+            f.seek(2)
+            while True:
+                byte = f.read(1)
+                while byte and byte != b'\xff':
+                    byte = f.read(1)
+                while byte == b'\xff':
+                    byte = f.read(1)
+                if not byte:
+                    return None
+                marker = byte[0]
+                if marker == 0x01 or 0xD0 <= marker <= 0xD9:
+                    continue
+                segment = f.read(2)
+                if len(segment) < 2:
+                    return None
+                length = struct.unpack('>H', segment)[0]
+                if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+                    sof = f.read(5)
+                    if len(sof) < 5:
+                        return None
+                    height, width = struct.unpack('>HH', sof[1:5])
+                    return ('image/jpeg', width, height) if width and height else None
+                f.seek(length - 2, os.SEEK_CUR)
+
+    return None
+
+
 class ImageCaptionGenerator:
     """Image caption generator"""
 
     def __init__(self, md_file_path: str, max_workers: int = DEFAULT_MAX_WORKERS):
         self.md_file_path = Path(md_file_path)
         self.md_dir = self.md_file_path.parent
-        self.content = ""
+        # Resolved once; image paths are joined onto it lexically instead of resolving each one
+        self._md_dir_resolved = str(self.md_dir.resolve())
         self.images = []
         self.max_workers = max_workers
 
-    def load_markdown(self) -> None:
-        """Load Markdown file content into memory"""
-        if not self.md_file_path.exists():
-            raise FileNotFoundError(f"Markdown file not found: {self.md_file_path}")
-
-        with open(self.md_file_path, 'r', encoding='utf-8') as f:
-            self.content = f.read()
-
-    def _find_reference_section(self, lines: List[str]) -> Optional[int]:
-        """Find the starting position of the Reference section"""
-        for i, line in enumerate(lines):
-            line_stripped = line.strip().lower()
-            if line_stripped.startswith('#'):
-                title = re.sub(r'^#+\s*', '', line_stripped)
-                for keyword in REFERENCE_KEYWORDS:
-                    if title == keyword or title.startswith(keyword):
-                        return i
-        return None
-
-    def _get_section(self, lines: List[str], image_line_idx: int) -> str:
-        """Get the section name where the image is located"""
-        for i in range(image_line_idx, -1, -1):
-            line = lines[i].strip()
-            if line.startswith('#'):
-                title = re.sub(r'^#+\s*', '', line).lower()
-                for section_type, keywords in SECTION_KEYWORDS.items():
-                    for keyword in keywords:
-                        if keyword in title:
-                            return section_type
-                return re.sub(r'^#+\s*', '', lines[i].strip())
-        return "unknown"
-
-    def _get_image_size(self, image_path: str) -> Tuple[str, Optional[Tuple[int, int]]]:
-        """Get the pixel size of the image"""
+    def _heading_section(self, heading_line: str) -> str:
+        """Get the section name a heading line starts"""
+        title = _HEADER_PREFIX_RE.sub('', heading_line.strip())
+        lowered = title.lower()
+        match = _SECTION_RE.match(lowered)
+        if match:
+            return match.lastgroup
+        return title
+
+    def _get_image_size(self, full_path: str) -> Tuple[str, Optional[Tuple[int, int]], Optional[str]]:
+        """Get the pixel size and MIME type of the image"""
         try:
-            full_path = self.md_dir / image_path
-            if not full_path.exists():
-                return "Unknown", None
-            with Image.open(full_path) as img:
-                width, height = img.size
-                return f"{width}x{height}", (width, height)
+            if not os.path.exists(full_path):
+                return "Unknown", None, None
+            header = _read_image_header(full_path)
+            if header is not None:
+                mime, width, height = header
+            else:
+                from PIL import Image
+
+                with Image.open(full_path) as img:
+                    mime = Image.MIME.get(img.format)
+                    width, height = img.size
+            return f"{width}x{height}", (width, height), mime
         except Exception:
-            return "Error", None
+            return "Error", None, None
 
-    def _encode_image_to_base64(self, image_path: str) -> Optional[str]:
-        """Encode image file to base64 string"""
+    def _image_file(self, image_path: str) -> Optional[Path]:
+        """Locate an image file relative to the Markdown directory, or None if it does not exist"""
+        path = Path(image_path)
+        if not path.is_absolute():
+            path = self.md_dir / image_path
+        return path if path.exists() else None
+
+    def _hash_image(self, image_path: str) -> Optional[str]:
+        """SHA-256 hex digest of an image file, or None if it cannot be read (blocking)"""
         try:
-            path = Path(image_path)
-            if not path.is_absolute():
-                path = self.md_dir / image_path
-            if not path.exists():
+            path = self._image_file(image_path)
+            if path is None:
                 return None
             with open(path, 'rb') as image_file:
-                return base64.b64encode(image_file.read()).decode('utf-8')
+                return hashlib.file_digest(image_file, 'sha256').hexdigest()
         except Exception:
             return None
 
-    def _generate_caption_with_vlm(self, image_path: str, section: str,
-                                   original_title: str) -> Optional[Dict[str, str]]:
-        """Use VLM to generate image title and description"""
-        base64_image = self._encode_image_to_base64(image_path)
-        if not base64_image:
+    def _read_image(self, image_path: str, mime: Optional[str]) -> Optional[str]:
+        """Read an image file and return the URL to send the VLM (blocking)"""
+        try:
+            path = self._image_file(image_path)
+            if path is None:
+                return None
+            if VLM_IMAGE_MODE == "file_url":
+                return path.as_uri()
+            with open(path, 'rb') as image_file:
+                data = image_file.read()
+            return f"data:{mime or 'image/jpeg'};base64,{base64.b64encode(data).decode('utf-8')}"
+        except Exception:
             return None
 
-        prompt = VLM_CAPTION_PROMPT.format(
-            section=section,
-            original_title=original_title if original_title else 'None'
-        )
+    async def _load_image(self, image_path: str, mime: Optional[str]) -> Optional[str]:
+        """Encode an image file on a worker thread, so other requests keep progressing"""
+        return await asyncio.to_thread(self._read_image, image_path, mime)
 
+    async def _generate_caption_with_vlm(self, client: "httpx.AsyncClient", image_url: str,
+                                         prompt: str) -> Optional[Dict[str, str]]:
+        """Use VLM to generate image title and description"""
         try:
             headers = {
                 'Authorization': f"Bearer {VLM_CONFIG['api_key']}",
@@ -283,7 +493,7 @@ class ImageCaptionGenerator:
                             {
                                 'type': 'image_url',
                                 'image_url': {
-                                    'url': f"data:image/jpeg;base64,{base64_image}"
+                                    'url': image_url
                                 }
                             }
                         ]
@@ -293,11 +503,10 @@ class ImageCaptionGenerator:
                 'temperature': VLM_TEMPERATURE
             }
 
-            response = requests.post(
+            response = await client.post(
                 f"{VLM_CONFIG['base_url']}/chat/completions",
                 headers=headers,
-                json=payload,
-                timeout=VLM_TIMEOUT
+                json=payload
             )
 
             if response.status_code == 200:
@@ -307,13 +516,14 @@ class ImageCaptionGenerator:
                 if not answer:
                     return None
 
-                # Try to parse JSON format
+                # Try to parse JSON format; a bare JSON object needs no code-fence search
                 try:
-                    json_match = re.search(r'```json\s*(\{.*?\})\s*```', answer, re.DOTALL)
-                    if json_match:
-                        answer = json_match.group(1)
+                    if not (answer[:1] == '{' and answer[-1:] == '}'):
+                        json_match = _JSON_BLOCK_RE.search(answer)
+                        if json_match:
+                            answer = json_match.group(1)
 
-                    caption_data = json.loads(answer)
+                    caption_data = _json_loads(answer)
                     if 'title' in caption_data and 'description' in caption_data:
                         return caption_data
                     return None
@@ -327,41 +537,51 @@ class ImageCaptionGenerator:
             return None
 
     def extract_images(self) -> List[Dict]:
-        """Extract basic information of all images from Markdown document"""
-        self.load_markdown()
-        lines = self.content.split('\n')
+        """Extract basic information of all images from Markdown document, stopping at the Reference section"""
+        if not self.md_file_path.exists():
+            raise FileNotFoundError(f"Markdown file not found: {self.md_file_path}")
 
-        reference_line_idx = self._find_reference_section(lines)
-        image_pattern = r'!\[.*?\]\((.*?)\)'
+        section = "unknown"
+        # Image on the previous line, waiting to see whether the next line is its Figure/Table title
+        pending = None
         idx = 1
 
-        i = 0
-        while i < len(lines):
-            if reference_line_idx is not None and i >= reference_line_idx:
-                break
-
-            line = lines[i]
-            match = re.search(image_pattern, line)
-
-            if match:
-                image_path = match.group(1)
-                absolute_path = str((self.md_dir / image_path).resolve())
-
-                original_title = ""
-                if i + 1 < len(lines):
-                    next_line = lines[i + 1].strip()
-                    if next_line.startswith('Figure') or next_line.startswith('Table'):
-                        original_title = next_line
-
-                pixel_size, dimensions = self._get_image_size(image_path)
-                section = self._get_section(lines, i)
+        with open(self.md_file_path, 'r', encoding='utf-8') as f:
+            for i, line in enumerate(f):
+                line = line.rstrip('\n')
+                stripped = line.strip()
+
+                if pending is not None:
+                    if stripped.startswith('Figure') or stripped.startswith('Table'):
+                        pending['original_title'] = stripped
+                    pending = None
+
+                match = _STRUCTURAL_RE.search(line)
+                if match is None:
+                    continue
+
+                if match.group('heading'):
+                    if _HEADER_PREFIX_RE.sub('', stripped.lower()).startswith(_REFERENCE_PREFIXES):
+                        break
+                    section = self._heading_section(line)
+                    # A heading line can still carry an image
+                    match = _IMAGE_RE.search(line)
+                    if match is None:
+                        continue
+                    image_path = match.group(1)
+                else:
+                    image_path = match.group('image')
+
+                absolute_path = os.path.normpath(os.path.join(self._md_dir_resolved, image_path))
+                pixel_size, dimensions, mime = self._get_image_size(absolute_path)
 
                 image_info = {
                     'idx': idx,
                     'path': absolute_path,
                     'pixel_size': pixel_size,
                     'dimensions': dimensions,
-                    'original_title': original_title,
+                    'mime': mime,
+                    'original_title': '',
                     'section': section,
                     'generated_title': '',
                     'description': '',
@@ -369,52 +589,88 @@ class ImageCaptionGenerator:
                 }
 
                 self.images.append(image_info)
+                pending = image_info
                 idx += 1
 
-            i += 1
-
         return self.images
 
-    def generate_captions_batch(self) -> None:
-        """Batch and concurrently generate titles and descriptions for all images"""
-        if not self.images:
-            return
+    async def _generate_captions_async(self, client: Optional["httpx.AsyncClient"] = None) -> None:
+        """Caption all images on one event loop, at most max_workers VLM requests in flight"""
+        import httpx
 
-        def generate_single_caption(img_info: Dict) -> Tuple[int, Optional[Dict[str, str]]]:
-            idx = img_info['idx']
-            image_path = img_info['path']
-            section = img_info['section']
-            original_title = img_info['original_title']
+        semaphore = asyncio.Semaphore(self.max_workers)
+        # Images are encoded ahead of a free request slot, but never more than
+        # 2 * max_workers of them are held in memory at once
+        prefetch = asyncio.Semaphore(2 * self.max_workers)
 
-            caption_result = self._generate_caption_with_vlm(
-                image_path, section, original_title
+        # Papers often reuse a figure: caption each distinct image once and share the result
+        digests = await asyncio.gather(
+            *(asyncio.to_thread(self._hash_image, img['path']) for img in self.images)
+        )
+        groups: Dict[str, List[Dict]] = {}
+        for img, digest in zip(self.images, digests):
+            if digest:
+                groups.setdefault(digest, []).append(img)
+
+        async def generate_single_caption(client: "httpx.AsyncClient", image_digest: str,
+                                          img_info: Dict) -> Optional[Dict[str, str]]:
+            prompt = VLM_CAPTION_PROMPT.format(
+                section=img_info['section'],
+                original_title=img_info['original_title'] if img_info['original_title'] else 'None'
             )
 
+            cache_key = _caption_cache_key(image_digest, prompt)
+            caption_result = await asyncio.to_thread(_load_cached_caption, cache_key)
             if caption_result:
-                return (idx, caption_result)
-            else:
-                return (idx, None)
+                return caption_result
 
-        results = {}
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            future_to_img = {
-                executor.submit(generate_single_caption, img): img
-                for img in self.images
-            }
+            async with prefetch:
+                image_url = await self._load_image(img_info['path'], img_info['mime'])
+                if not image_url:
+                    return None
 
-            for future in as_completed(future_to_img):
-                try:
-                    idx, caption_result = future.result()
-                    if caption_result:
-                        results[idx] = caption_result
-                except Exception:
-                    pass
+                async with semaphore:
+                    caption_result = await self._generate_caption_with_vlm(client, image_url, prompt)
+
+            if caption_result:
+                await asyncio.to_thread(_store_cached_caption, cache_key, caption_result)
+            return caption_result
+
+        async def generate_all_captions(client: "httpx.AsyncClient") -> List[Any]:
+            return await asyncio.gather(
+                *(
+                    # The occurrence with the most informative original title stands in for the group
+                    generate_single_caption(client, digest, max(group, key=lambda img: len(img['original_title'])))
+                    for digest, group in groups.items()
+                ),
+                return_exceptions=True
+            )
+
+        if client is not None:
+            results = await generate_all_captions(client)
+        else:
+            # One pooled client per run: every request after the first reuses a kept-alive connection
+            limits = httpx.Limits(
+                max_connections=self.max_workers,
+                max_keepalive_connections=self.max_workers,
+                keepalive_expiry=30
+            )
+            async with httpx.AsyncClient(timeout=VLM_TIMEOUT, limits=limits) as own_client:
+                results = await generate_all_captions(own_client)
 
         # Update image titles and descriptions
-        for img in self.images:
-            if img['idx'] in results:
-                img['generated_title'] = results[img['idx']]['title']
-                img['description'] = results[img['idx']]['description']
+        for group, caption_result in zip(groups.values(), results):
+            if isinstance(caption_result, dict):
+                for img in group:
+                    img['generated_title'] = caption_result['title']
+                    img['description'] = caption_result['description']
+
+    def generate_captions_batch(self) -> None:
+        """Batch and concurrently generate titles and descriptions for all images"""
+        if not self.images:
+            return
+
+        _run_sync(self._generate_captions_async())
 
     def process(self) -> List[Dict]:
         """Complete workflow: extract images + generate titles"""
@@ -422,6 +678,13 @@ class ImageCaptionGenerator:
         self.generate_captions_batch()
         return self.images
 
+    async def process_async(self, client: Optional["httpx.AsyncClient"] = None) -> List[Dict]:
+        """Complete workflow on the running event loop, optionally sharing a caller-owned VLM client"""
+        await asyncio.to_thread(self.extract_images)
+        if self.images:
+            await self._generate_captions_async(client)
+        return self.images
+
     def save_to_json(self, output_path: str) -> None:
         """Save results as JSON file"""
         output_data = []
@@ -440,61 +703,25 @@ class ImageCaptionGenerator:
             json.dump(output_data, f, ensure_ascii=False, indent=2)
 
     def save_to_html(self, output_path: str) -> None:
-        """Save results as HTML file (visual display)"""
-        # HTML template (simplified version)
-        html_content = f"""<!DOCTYPE html>
-<html lang="zh-CN">
-<head>
-    <meta charset="UTF-8">
-    <title>Image Caption Generation Results</title>
-    <style>
-        body {{ font-family: -apple-system, sans-serif; padding: 20px; background: #f5f5f5; }}
-        .container {{ max-width: 1400px; margin: 0 auto; background: white; border-radius: 10px; padding: 30px; }}
-        .header {{ text-align: center; margin-bottom: 30px; }}
-        .stats {{ display: flex; justify-content: space-around; margin-bottom: 30px; }}
-        .stat-item {{ text-align: center; }}
-        .stat-number {{ font-size: 2em; font-weight: bold; color: #667eea; }}
-        .image-grid {{ display: grid; grid-template-columns: repeat(auto-fill, minmax(450px, 1fr)); gap: 30px; }}
-        .image-card {{ border: 1px solid #ddd; border-radius: 10px; overflow: hidden; }}
-        .image-preview {{ width: 100%; height: 300px; object-fit: contain; padding: 10px; background: #f8f9fa; }}
-        .image-info {{ padding: 20px; }}
-        .generated-title {{ font-size: 1.2em; color: #667eea; font-weight: bold; margin-bottom: 10px; }}
-        .description {{ padding: 10px; background: #f8f9fa; border-radius: 5px; margin: 10px 0; }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>Image Caption Generation Results</h1>
-        </div>
-        <div class="stats">
-            <div class="stat-item"><div class="stat-number">{len(self.images)}</div><div>Total Images</div></div>
-            <div class="stat-item"><div class="stat-number">{len([img for img in self.images if img['generated_title']])}</div><div>Success</div></div>
-            <div class="stat-item"><div class="stat-number">{len([img for img in self.images if not img['generated_title']])}</div><div>Failed</div></div>
-        </div>
-        <div class="image-grid">
-"""
-
-        for img in self.images:
-            html_content += f"""
-            <div class="image-card">
-                <img src="{img['path']}" alt="Image {img['idx']}" class="image-preview">
-                <div class="image-info">
-                    <div class="generated-title">{img['generated_title'] if img['generated_title'] else 'Title generation failed'}</div>
-                    {f'<div class="description">{img["description"]}</div>' if img['description'] else ''}
-                    <div><strong>Path:</strong> {img['path']}</div>
-                    <div><strong>Size:</strong> {img['pixel_size']}</div>
-                    <div><strong>Section:</strong> {img['section']}</div>
-                </div>
-            </div>
-"""
-
-        html_content += """
-        </div>
-    </div>
-</body>
-</html>
-"""
+        """Save results as HTML file (visual display), writing one card at a time"""
+        success_count = len([img for img in self.images if img['generated_title']])
 
         with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+            f.write(_HTML_HEADER.format(
+                total=len(self.images),
+                success=success_count,
+                failed=len(self.images) - success_count
+            ))
+
+            for img in self.images:
+                f.write(_HTML_CARD.format(
+                    src=escape(quote(img['path'])),
+                    path=escape(img['path']),
+                    idx=img['idx'],
+                    title=escape(str(img['generated_title'] or 'Title generation failed')),
+                    description=f'<div class="description">{escape(str(img["description"]))}</div>' if img['description'] else '',
+                    pixel_size=escape(img['pixel_size']),
+                    section=escape(img['section'])
+                ))
+
+            f.write(_HTML_FOOTER)
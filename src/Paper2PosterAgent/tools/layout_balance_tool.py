@@ -19,15 +19,15 @@ Optimizes HTML poster layout based on three-column height information
 
 import os
 import re
+import functools
+import importlib.util
 from pathlib import Path
 from typing import Dict, Any, Optional
 
-# Check dependencies
-try:
-    from openai import OpenAI
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
+from ._openai_client import get_openai_client
+
+# Check dependencies without importing them; openai is imported on first use
+OPENAI_AVAILABLE = importlib.util.find_spec("openai") is not None
 
 try:
     from dotenv import load_dotenv
@@ -36,6 +36,9 @@ except ImportError:
     pass
 
 
+_PROMPT_TEMPLATE_PATH = Path(__file__).parent / "prompts" / "layout_balance.md"
+
+
 def layout_balance_tool(
     html_file_path: str,
     col_height_dict: Dict[str, str],
@@ -127,12 +130,20 @@ def _read_file(file_path: str) -> str:
 
 
 def _save_file(file_path: str, content: str) -> None:
-    """Save file content"""
-    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    """Save file content, creating the parent directory only if it is missing"""
+    parent_dir = os.path.dirname(file_path)
+    if parent_dir and not os.path.isdir(parent_dir):
+        os.makedirs(parent_dir, exist_ok=True)
     with open(file_path, 'w', encoding='utf-8') as f:
         f.write(content)
 
 
+@functools.cache
+def _load_prompt_template() -> str:
+    """Read the layout balancing prompt once; it does not change while the process runs"""
+    return _read_file(str(_PROMPT_TEMPLATE_PATH))
+
+
 def _extract_html(content: str) -> str:
     """Extract HTML code from API returned content"""
     # Try to match markdown code block format ```html...``` or ```...```
@@ -172,11 +183,8 @@ def _generate_html(html_content: str, col_height_dict: Dict, markdown_content: s
     LLM_MODEL = os.getenv('LLM_MODEL')
     LLM_TEMPERATURE = float(os.getenv('LLM_TEMPERATURE') or '0.9')
 
-    # Initialize OpenAI client
-    client = OpenAI(
-        base_url=LLM_BASE_URL,
-        api_key=LLM_API_KEY
-    )
+    # Get (cached) OpenAI client
+    client = get_openai_client(LLM_BASE_URL, LLM_API_KEY)
 
     # Call API
     response = client.chat.completions.create(
@@ -223,8 +231,7 @@ def _balance_poster_layout(
         markdown_content = _read_file(markdown_file_path)
 
     # Step 3: Read prompt template
-    prompt_template_path = Path(__file__).parent / "prompts" / "layout_balance.md"
-    prompt_template = _read_file(str(prompt_template_path))
+    prompt_template = _load_prompt_template()
 
     # Step 4: Generate HTML
     html_content = _generate_html(html_content, col_height_dict, markdown_content, prompt_template)
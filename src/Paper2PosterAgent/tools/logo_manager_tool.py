@@ -19,11 +19,17 @@ Provides logo search, download, and matching functionality
 
 import os
 import re
+import struct
 import logging
+import functools
+import threading
+from dataclasses import dataclass
 import requests
+from requests.adapters import HTTPAdapter
 from io import BytesIO
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Optional, List, Set, Tuple, Callable
+from concurrent.futures import ThreadPoolExecutor
 from difflib import SequenceMatcher
 from PIL import Image
 from dotenv import load_dotenv
@@ -33,6 +39,129 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Common abbreviation mappings, checked in order: the first pattern found anywhere in the name wins
+_ABBREVIATIONS = [
+    # Universities
+    (r'\bmit\b', 'mit'),
+    (r'\bcmu\b', 'cmu'),
+    (r'\bucla\b', 'ucla'),
+    (r'\bucsd\b', 'ucsd'),
+    (r'\bucsb\b', 'ucsb'),
+    (r'\bucb\b|berkeley', 'ucb'),
+    (r'\bnyu\b', 'nyu'),
+    (r'\beth\b', 'eth'),
+    (r'\bepfl\b', 'epfl'),
+    (r'\bcal\s*tech|caltech', 'caltech'),
+
+    # Conferences
+    (r'\bneurips\b|\bnips\b', 'neurips'),
+    (r'\biclr\b', 'iclr'),
+    (r'\bicml\b', 'icml'),
+    (r'\bcvpr\b', 'cvpr'),
+    (r'\biccv\b', 'iccv'),
+    (r'\beccv\b', 'eccv'),
+    (r'\baaai\b', 'aaai'),
+    (r'\bijcai\b', 'ijcai'),
+    (r'\bacl\b', 'acl'),
+    (r'\bemnlp\b', 'emnlp'),
+
+    # Companies/Labs
+    (r'\bgoogle\b', 'google'),
+    (r'\bdeep\s*mind|deepmind\b', 'deepmind'),
+    (r'\bmeta\b|\bfair\b', 'meta'),
+    (r'\bopenai\b', 'openai'),
+    (r'\bmicrosoft\b|\bmsr\b', 'microsoft'),
+    (r'\bnvidia\b', 'nvidia'),
+    (r'\bamazon\b', 'amazon'),
+    (r'\bapple\b', 'apple'),
+]
+
+# All abbreviation patterns in one regex. Each group is a lookahead anchored at the start of
+# the name, so alternatives are tried in table order rather than by leftmost match position
+_ABBREV_RE = re.compile(
+    '|'.join(f'(?P<g{i}>(?=.*?(?:{pattern})))' for i, (pattern, _) in enumerate(_ABBREVIATIONS)),
+    re.DOTALL
+)
+_ABBREV_VALUES = [abbrev for _, abbrev in _ABBREVIATIONS]
+
+_CAPWORD_RE = re.compile(r'\b[A-Z][a-z]*')
+_YEAR_SUFFIX_RE = re.compile(r'\s*\d{4}\s*$')
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9]+')
+
+# Common institution patterns
+_INSTITUTION_PATTERNS = [
+    r"(?:University of|University) [\w\s]+",
+    r"[\w\s]+ University",
+    r"[\w\s]+ Institute of Technology",
+    r"[\w\s]+ Institute",
+    r"MIT|CMU|UCLA|UCSD|NYU|ETH|EPFL|Stanford|Berkeley|Harvard|Princeton|Oxford|Cambridge",
+    r"Google Research|DeepMind|Microsoft Research|Facebook AI Research|OpenAI|NVIDIA Research",
+    r"Max Planck Institute",
+    r"[\w\s]+ College",
+    r"[\w\s]+ Research",
+    r"[\w\s]+ Lab",
+    r"[\w\s]+ Laboratory"
+]
+_INSTITUTION_RE = re.compile('|'.join(f'({p})' for p in _INSTITUTION_PATTERNS), re.IGNORECASE)
+_PAREN_RE = re.compile(r'\((.*?)\)')
+
+
+def _search_institution(text: str) -> Optional[str]:
+    """Return the leftmost institution mention in text, stopping at the first match"""
+    match = _INSTITUTION_RE.search(text)
+    return match[match.lastindex].strip() if match else None
+
+
+# HTTP sessions are kept per thread (requests does not guarantee Session is thread-safe),
+# so batch downloads on pool threads each reuse their own pooled connections
+_SESSIONS = threading.local()
+
+
+def _get_session() -> requests.Session:
+    """Return the calling thread's HTTP session, creating it on first use"""
+    session = getattr(_SESSIONS, "session", None)
+    if session is None:
+        session = requests.Session()
+        session.mount("http://", HTTPAdapter(pool_connections=16))
+        session.mount("https://", HTTPAdapter(pool_connections=16))
+        _SESSIONS.session = session
+    return session
+
+
+# Fuzzy matching stops at the first candidate scoring at least this well
+_EARLY_EXIT_SCORE = 0.98
+
+# Web logos are only ever shown at poster size; JPEG decoding may stop at this resolution
+_MAX_RASTER_SIZE = (1024, 1024)
+
+# Logo directory -> (mtime in ns, {normalized name: file}) from the last scan
+_SCAN_CACHE: Dict[Path, Tuple[int, Dict[str, "LogoEntry"]]] = {}
+# directory -> (scan result the names came from, sorted logo names)
+_SORTED_NAMES_CACHE: Dict[Path, Tuple[Dict[str, "LogoEntry"], List[str]]] = {}
+
+
+# Every name token seen at scan time gets its own bit, so token sets become int bitmasks
+_TOKEN_BITS: Dict[str, int] = {}
+_TOKEN_BITS_LOCK = threading.Lock()
+
+
+def _token_mask(tokens: Set[str]) -> int:
+    """Build the bitmask of a name's tokens, assigning bits to tokens not seen before"""
+    mask = 0
+    with _TOKEN_BITS_LOCK:
+        for token in tokens:
+            mask |= 1 << _TOKEN_BITS.setdefault(token, len(_TOKEN_BITS))
+    return mask
+
+
+@dataclass(slots=True)
+class LogoEntry:
+    """A stored logo file with the matching keys derived from its name"""
+    path: Path
+    abbrev: Optional[str]
+    token_mask: int
+    token_count: int
+
 
 class LogoManager:
     """Class for managing logo storage and retrieval (using file matching)"""
@@ -64,56 +193,18 @@ class LogoManager:
         MIT, CMU, UCLA etc. are returned directly
         University of California Berkeley → UCB
         """
-        # Common abbreviation mappings
-        abbrev_map = {
-            # Universities
-            r'\bmit\b': 'mit',
-            r'\bcmu\b': 'cmu',
-            r'\bucla\b': 'ucla',
-            r'\bucsd\b': 'ucsd',
-            r'\bucsb\b': 'ucsb',
-            r'\bucb\b|berkeley': 'ucb',
-            r'\bnyu\b': 'nyu',
-            r'\beth\b': 'eth',
-            r'\bepfl\b': 'epfl',
-            r'\bcal\s*tech|caltech': 'caltech',
-
-            # Conferences
-            r'\bneurips\b|\bnips\b': 'neurips',
-            r'\biclr\b': 'iclr',
-            r'\bicml\b': 'icml',
-            r'\bcvpr\b': 'cvpr',
-            r'\biccv\b': 'iccv',
-            r'\beccv\b': 'eccv',
-            r'\baaai\b': 'aaai',
-            r'\bijcai\b': 'ijcai',
-            r'\bacl\b': 'acl',
-            r'\bemnlp\b': 'emnlp',
-
-            # Companies/Labs
-            r'\bgoogle\b': 'google',
-            r'\bdeep\s*mind|deepmind\b': 'deepmind',
-            r'\bmeta\b|\bfair\b': 'meta',
-            r'\bopenai\b': 'openai',
-            r'\bmicrosoft\b|\bmsr\b': 'microsoft',
-            r'\bnvidia\b': 'nvidia',
-            r'\bamazon\b': 'amazon',
-            r'\bapple\b': 'apple',
-        }
-
-        name_lower = name.lower()
 
         # Check if it matches known abbreviations
-        for pattern, abbrev in abbrev_map.items():
-            if re.search(pattern, name_lower):
-                return abbrev
+        match = _ABBREV_RE.match(name.lower())
+        if match:
+            return _ABBREV_VALUES[int(match.lastgroup[1:])]
 
         # If it's all uppercase and short (possibly an abbreviation)
-        if name.isupper() and len(name) <= 6:
+        if len(name) <= 6 and name.isupper():
             return name.lower()
 
         # Try to generate abbreviation: take first letter of each capitalized word
-        words = re.findall(r'\b[A-Z][a-z]*', name)
+        words = _CAPWORD_RE.findall(name)
         if len(words) >= 2:
             abbrev = ''.join(w[0].lower() for w in words)
             if len(abbrev) <= 6:
@@ -121,45 +212,55 @@ class LogoManager:
 
         return None
 
-    def _normalize_name(self, name: str) -> str:
-        """Normalize name for matching"""
-        # Remove year suffix
-        name = re.sub(r'\s*\d{4}\s*$', '', name)
-        # Convert to lowercase and replace special characters
-        name = name.lower()
-        name = re.sub(r'[^a-z0-9]+', '_', name)
-        name = name.strip('_')
-        return name
-
-    def _fuzzy_match(self, query: str, candidates: List[str]) -> Tuple[Optional[str], float]:
+    @staticmethod
+    def _normalize_name(name: str) -> str:
+        """Normalize name for matching: drop the year suffix, lowercase, join alphanumeric runs with '_'"""
+        return _NON_ALNUM_RE.sub('_', _YEAR_SUFFIX_RE.sub('', name).lower()).strip('_')
+
+    def _fuzzy_match(self, query: str, candidates: Dict[str, LogoEntry]) -> Tuple[Optional[str], float]:
         """
         Find the best fuzzy match in the candidate list
         Supports abbreviation matching: MIT = Massachusetts Institute of Technology
 
         Args:
             query: Search query
-            candidates: List of candidate strings
+            candidates: Dictionary mapping candidate names to their logo entries
 
         Returns:
             Best matching candidate and similarity score (0-1)
         """
         query_norm = self._normalize_name(query)
         query_abbrev = self._extract_abbreviation(query)
+        # Query tokens that no stored logo uses can only add to the union of a Jaccard comparison
+        query_mask = 0
+        query_unknown = 0
+        query_tokens = set(query_norm.split('_'))
+        query_count = len(query_tokens)
+        for token in query_tokens:
+            bit = _TOKEN_BITS.get(token)
+            if bit is None:
+                query_unknown += 1
+            else:
+                query_mask |= 1 << bit
+
+        # Level 1: Exact match
+        if query_norm in candidates:
+            return query_norm, 1.0
+        # Level 2a: Abbreviation exact match, MIT matches mit.png
+        if query_abbrev and query_abbrev in candidates:
+            logger.info(f"Abbreviation exact match: {query} -> {query_abbrev}")
+            return query_abbrev, 0.98
 
         best_match = None
         best_score = 0.0
+        # SequenceMatcher caches its analysis of seq2, which set_seq2 rebuilds for every
+        # candidate, so reusing one matcher saves nothing; the quick-ratio pruning in Level 5 does
+        matcher = SequenceMatcher(None, query_norm)
 
-        for candidate in candidates:
-            # Level 1: Exact match
-            if query_norm == candidate:
-                return candidate, 1.0
-
-            # Level 2: Abbreviation match (high priority)
+        for candidate, entry in candidates.items():
+            # Level 2b: Abbreviation match (high priority)
             if query_abbrev:
-                candidate_abbrev = self._extract_abbreviation(candidate)
-                if query_abbrev == candidate:  # MIT matches mit.png
-                    logger.info(f"Abbreviation exact match: {query_abbrev} == {candidate}")
-                    return candidate, 0.98
+                candidate_abbrev = entry.abbrev
                 if candidate_abbrev and query_abbrev == candidate_abbrev:
                     logger.info(f"Abbreviation match: {query_abbrev} == {candidate_abbrev}")
                     score = 0.95
@@ -177,13 +278,11 @@ class LogoManager:
                 continue
 
             # Level 4: Token-based matching (keyword overlap)
-            query_tokens = set(query_norm.split('_'))
-            candidate_tokens = set(candidate.split('_'))
-
-            if query_tokens and candidate_tokens:
-                intersection = query_tokens & candidate_tokens
-                union = query_tokens | candidate_tokens
-                jaccard = len(intersection) / len(union) if union else 0
+            # Jaccard is at most min/max of the two token counts, so lopsided pairs cannot reach 0.5
+            if 2 * min(query_count, entry.token_count) >= max(query_count, entry.token_count):
+                intersection = (query_mask & entry.token_mask).bit_count()
+                union = (query_mask | entry.token_mask).bit_count() + query_unknown
+                jaccard = intersection / union
 
                 if jaccard >= 0.5:  # 50% keyword overlap
                     score = 0.7 + (jaccard * 0.2)  # 0.7-0.9 score range
@@ -193,10 +292,18 @@ class LogoManager:
                     continue
 
             # Level 5: Sequence similarity (Levenshtein)
-            score = SequenceMatcher(None, query_norm, candidate).ratio()
+            # real_quick_ratio/quick_ratio are cheap upper bounds on ratio(), so candidates
+            # that cannot beat the current best skip the full matching-block computation
+            matcher.set_seq2(candidate)
+            if matcher.real_quick_ratio() <= best_score or matcher.quick_ratio() <= best_score:
+                continue
+            score = matcher.ratio()
             if score > best_score:
                 best_match = candidate
                 best_score = score
+                # As close as an abbreviation exact hit; no need to keep looking
+                if best_score >= _EARLY_EXIT_SCORE:
+                    break
 
         # Lower threshold because abbreviation matching is smarter
         if best_score >= 0.5:  # 50% similarity threshold
@@ -204,50 +311,58 @@ class LogoManager:
 
         return None, 0.0
 
-    def _scan_directory(self, directory: Path) -> Dict[str, Path]:
+    def _scan_directory(self, directory: Path) -> Dict[str, LogoEntry]:
         """
         Scan PNG files in directory
 
         Returns:
-            Dictionary mapping normalized names to file paths
+            Dictionary mapping normalized names to logo entries
         """
-        logos = {}
-        if directory.exists():
-            for file in directory.glob("*.png"):
-                name = file.stem.lower()
-                logos[name] = file
-        return logos
-
-    def get_logo_path(self, name: str, category: str = "auto", use_google: bool = False) -> Optional[Path]:
-        """
-        Get logo file path using fuzzy matching
+        try:
+            mtime = directory.stat().st_mtime_ns
+        except OSError:
+            return {}
 
-        Args:
-            name: Conference/institution name
-            category: Logo type ("conference", "institute", or "auto")
-            use_google: Whether to use Google custom search
+        # Adding, removing or renaming a logo bumps the directory mtime, so an unchanged
+        # mtime means the previous scan is still accurate
+        cached = _SCAN_CACHE.get(directory)
+        if cached and cached[0] == mtime:
+            return cached[1]
 
-        Returns:
-            Logo file path, or None if not found
-        """
-        logger.info(f"Looking for logo: '{name}' (category: {category})")
+        logos = {}
+        # scandir reports the file type from the directory listing itself, without a stat per entry
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".png") or entry.name == ".png" or not entry.is_file():
+                    continue
+                stem = entry.name[:-4].lower()
+                tokens = set(stem.split('_'))
+                logos[stem] = LogoEntry(
+                    path=Path(entry.path),
+                    abbrev=self._extract_abbreviation(stem),
+                    token_mask=_token_mask(tokens),
+                    token_count=len(tokens)
+                )
+        _SCAN_CACHE[directory] = (mtime, logos)
+        return logos
 
-        # Scan available logos
+    def _search_dirs(self, category: str) -> List[Tuple[str, Dict[str, LogoEntry]]]:
+        """Scan the logo directories to search for the given category"""
         conference_logos = self._scan_directory(self.base_path / "conferences")
         institute_logos = self._scan_directory(self.base_path / "institutes")
 
-        # Determine which directories to search
         if category == "conference":
-            search_dirs = [("conferences", conference_logos)]
             logger.info(f"Searching in: conferences/ ({len(conference_logos)} logos)")
+            return [("conferences", conference_logos)]
         elif category == "institute":
-            search_dirs = [("institutes", institute_logos)]
             logger.info(f"Searching in: institutes/ ({len(institute_logos)} logos)")
+            return [("institutes", institute_logos)]
         else:  # auto
-            search_dirs = [("conferences", conference_logos), ("institutes", institute_logos)]
             logger.info(f"Searching in: conferences/ ({len(conference_logos)} logos), institutes/ ({len(institute_logos)} logos)")
+            return [("conferences", conference_logos), ("institutes", institute_logos)]
 
-        # Try to find best match
+    def _match_local(self, name: str, search_dirs: List[Tuple[str, Dict[str, LogoEntry]]]) -> Optional[Path]:
+        """Find the best matching stored logo for a name, or None if nothing matches"""
         best_match = None
         best_score = 0.0
         best_path = None
@@ -255,23 +370,94 @@ class LogoManager:
 
         for dir_name, logos in search_dirs:
             if logos:
-                match, score = self._fuzzy_match(name, list(logos.keys()))
+                match, score = self._fuzzy_match(name, logos)
                 if match and score > best_score:
                     best_match = match
                     best_score = score
-                    best_path = logos[match]
+                    best_path = logos[match].path
                     best_dir = dir_name
 
         if best_path and best_path.exists():
             logger.info(f"MATCH FOUND: '{best_match}' in {best_dir}/ (similarity: {best_score:.1%})")
             logger.info(f"File: {best_path.name}")
             return best_path
+        return None
+
+    def get_logo_path(self, name: str, category: str = "auto", use_google: bool = False) -> Optional[Path]:
+        """
+        Get logo file path using fuzzy matching
+
+        Args:
+            name: Conference/institution name
+            category: Logo type ("conference", "institute", or "auto")
+            use_google: Whether to use Google custom search
+
+        Returns:
+            Logo file path, or None if not found
+        """
+        logger.info(f"Looking for logo: '{name}' (category: {category})")
+
+        best_path = self._match_local(name, self._search_dirs(category))
+        if best_path:
+            return best_path
 
         # If no match found, try downloading
         logger.info(f"No local match found (threshold: 60%)")
         logger.info(f"Attempting to download from web...")
         return self._download_and_save_logo(name, category, use_google=use_google)
 
+    def match_batch(self, queries: List[str], category: str = "auto") -> List[Optional[Path]]:
+        """
+        Match several names against the stored logos without downloading
+        The logo directories are scanned once and shared by all queries
+
+        Args:
+            queries: Conference/institution names
+            category: Logo type ("conference", "institute", or "auto")
+
+        Returns:
+            Logo file path for each query, or None where nothing matches
+        """
+        search_dirs = self._search_dirs(category)
+        return [self._match_local(query, search_dirs) for query in queries]
+
+    def get_logos_batch(self, names: List[str], category: str = "auto", use_google: bool = False,
+                        max_workers: int = 8) -> Dict[str, Optional[Path]]:
+        """
+        Get logo file paths for several names
+        Names are matched locally in one batch; the misses are downloaded concurrently,
+        once per target file, since names like "NeurIPS 2023" and "NeurIPS 2024" share one
+
+        Args:
+            names: Conference/institution names
+            category: Logo type ("conference", "institute", or "auto")
+            use_google: Whether to use Google custom search
+            max_workers: Maximum number of concurrent downloads
+
+        Returns:
+            Dictionary mapping each name to its logo file path, or None if not found
+        """
+        unique_names = list(dict.fromkeys(names))
+        logo_paths = dict(zip(unique_names, self.match_batch(unique_names, category)))
+
+        # Group the misses by the file _download_and_save_logo would write, so no two
+        # threads ever write the same path
+        missing: Dict[str, List[str]] = {}
+        for name, path in logo_paths.items():
+            if path is None:
+                missing.setdefault(self._normalize_name(name), []).append(name)
+
+        if missing:
+            logger.info(f"No local match for {len(missing)} logos, attempting to download from web...")
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                downloaded = executor.map(
+                    lambda group: self._download_and_save_logo(group[0], category, use_google=use_google),
+                    missing.values()
+                )
+                for group, path in zip(missing.values(), downloaded):
+                    logo_paths.update(dict.fromkeys(group, path))
+        return logo_paths
+
     def _download_and_save_logo(self, name: str, category: str, use_google: bool = False) -> Optional[Path]:
         """
         Try to download logo from web and save
@@ -360,7 +546,7 @@ class LogoManager:
                         'fileType': 'png|svg'
                     }
 
-                    response = requests.get(url, params=params)
+                    response = _get_session().get(url, params=params)
                     if response.status_code == 200:
                         data = response.json()
                         items = data.get('items', [])
@@ -389,7 +575,7 @@ class LogoManager:
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
             }
-            response = requests.get(url, headers=headers, timeout=10)
+            response = _get_session().get(url, headers=headers, timeout=10)
             response.raise_for_status()
 
             save_path.parent.mkdir(parents=True, exist_ok=True)
@@ -398,11 +584,8 @@ class LogoManager:
             if url.lower().endswith('.svg'):
                 try:
                     import cairosvg
-                    png_bytes = cairosvg.svg2png(bytestring=response.content, output_width=800)
-                    img = Image.open(BytesIO(png_bytes))
-                    if img.mode != 'RGBA':
-                        img = img.convert('RGBA')
-                    img.save(save_path, 'PNG', optimize=True)
+                    # Cairo renders to an ARGB surface, so its output is already an RGBA PNG
+                    save_path.write_bytes(cairosvg.svg2png(bytestring=response.content, output_width=800))
                     logger.info(f"Converted SVG to PNG and saved to {save_path}")
                     return True
                 except Exception as e:
@@ -413,6 +596,10 @@ class LogoManager:
             elif any(ext in url.lower() for ext in ['.jpg', '.jpeg', '.gif', '.bmp', '.png']):
                 try:
                     img = Image.open(BytesIO(response.content))
+                    # Let libjpeg downscale by a power of two while decoding large photos;
+                    # the result still covers _MAX_RASTER_SIZE on both axes
+                    if img.format == 'JPEG':
+                        img.draft('RGB', _MAX_RASTER_SIZE)
                     if img.mode != 'RGBA':
                         img = img.convert('RGBA')
                     img.save(save_path, 'PNG')
@@ -430,14 +617,20 @@ class LogoManager:
             logger.error(f"Failed to download logo from {url}: {e}")
             return False
 
+    def _sorted_logo_names(self, directory: Path) -> List[str]:
+        """Sorted logo names in directory, re-sorted only when the directory is rescanned"""
+        logos = self._scan_directory(directory)
+        cached = _SORTED_NAMES_CACHE.get(directory)
+        if cached is None or cached[0] is not logos:
+            cached = (logos, sorted(logos))
+            _SORTED_NAMES_CACHE[directory] = cached
+        return list(cached[1])
+
     def list_available_logos(self) -> Dict[str, List[str]]:
         """List all available logos in the system"""
-        conference_logos = self._scan_directory(self.base_path / "conferences")
-        institute_logos = self._scan_directory(self.base_path / "institutes")
-
         return {
-            "conferences": sorted(conference_logos.keys()),
-            "institutes": sorted(institute_logos.keys())
+            "conferences": self._sorted_logo_names(self.base_path / "conferences"),
+            "institutes": self._sorted_logo_names(self.base_path / "institutes")
         }
 
     def extract_first_author_institution(self, paper_content: str) -> Optional[str]:
@@ -454,89 +647,40 @@ class LogoManager:
 
         # Focus on first 100 lines (authors usually appear here)
         lines = paper_content.split('\n')[:100]
-
-        # Common institution patterns
-        institution_patterns = [
-            r"(?:University of|University) [\w\s]+",
-            r"[\w\s]+ University",
-            r"[\w\s]+ Institute of Technology",
-            r"[\w\s]+ Institute",
-            r"MIT|CMU|UCLA|UCSD|NYU|ETH|EPFL|Stanford|Berkeley|Harvard|Princeton|Oxford|Cambridge",
-            r"Google Research|DeepMind|Microsoft Research|Facebook AI Research|OpenAI|NVIDIA Research",
-            r"Max Planck Institute",
-            r"[\w\s]+ College",
-            r"[\w\s]+ Research",
-            r"[\w\s]+ Lab",
-            r"[\w\s]+ Laboratory"
-        ]
-
-        all_pattern = '|'.join(f'({p})' for p in institution_patterns)
-
-        # First pass: look for lines with superscript 1 (¹), usually indicating first author affiliation
-        first_institution = None
+        # Every pass stops at the first abstract/introduction line, so cut the author block there once
         for i, line in enumerate(lines):
-            if 'abstract' in line.lower() or 'introduction' in line.lower():
-                break
-
-            if '¹' in line:
-                matches = re.findall(all_pattern, line, re.IGNORECASE)
-                if matches:
-                    for match_groups in matches:
-                        for inst in match_groups:
-                            if inst:
-                                first_institution = inst.strip()
-                                logger.info(f"Found first author institution (from affiliation marker): {first_institution}")
-                                break
-                        if first_institution:
-                            break
-            if first_institution:
+            lower = line.lower()
+            if 'abstract' in lower or 'introduction' in lower:
+                del lines[i:]
                 break
 
-        # Second pass: if no superscript found, look for institution after author name
-        if not first_institution:
-            for i, line in enumerate(lines):
-                if 'abstract' in line.lower() or 'introduction' in line.lower():
-                    break
-
-                if i < 2:
-                    continue
-
-                if '(' in line and ')' in line:
-                    paren_content = re.findall(r'\((.*?)\)', line)
-                    for content in paren_content:
-                        inst_matches = re.findall(all_pattern, content, re.IGNORECASE)
-                        if inst_matches:
-                            for match_groups in inst_matches:
-                                for inst in match_groups:
-                                    if inst:
-                                        first_institution = inst.strip()
-                                        logger.info(f"Found first author institution (from parentheses): {first_institution}")
-                                        break
-                                if first_institution:
-                                    break
-                        if first_institution:
-                            break
-                if first_institution:
-                    break
-
-        # Third pass: if still not found, just look for first mentioned institution
-        if not first_institution:
-            for line in lines[:30]:
-                if 'abstract' in line.lower() or 'introduction' in line.lower():
-                    break
-
-                matches = re.findall(all_pattern, line, re.IGNORECASE)
-                if matches:
-                    for match_groups in matches:
-                        for inst in match_groups:
-                            if inst:
-                                first_institution = inst.strip()
-                                logger.info(f"Found institution (general search): {first_institution}")
-                                break
-                        if first_institution:
-                            break
-                if first_institution:
+        # Single pass over the author block, keeping the first hit of each kind. In priority order:
+        # a line with superscript 1 (¹), usually the first author's affiliation; an institution in
+        # parentheses after an author name (from the third line on); any institution in the first 30 lines
+        from_marker = from_parens = from_general = None
+        for i, line in enumerate(lines):
+            has_marker = '¹' in line
+            if has_marker or (from_general is None and i < 30):
+                inst = _search_institution(line)
+                if inst and has_marker:
+                    from_marker = inst
                     break
+                if inst and from_general is None and i < 30:
+                    from_general = inst
+
+            if from_parens is None and i >= 2 and '(' in line and ')' in line:
+                for content in _PAREN_RE.findall(line):
+                    from_parens = _search_institution(content)
+                    if from_parens:
+                        break
+
+        first_institution = from_marker or from_parens or from_general
+        if from_marker:
+            logger.info(f"Found first author institution (from affiliation marker): {first_institution}")
+        elif from_parens:
+            logger.info(f"Found first author institution (from parentheses): {first_institution}")
+        elif from_general:
+            logger.info(f"Found institution (general search): {first_institution}")
 
         if not first_institution:
             logger.warning("No institution found in author section")
@@ -546,6 +690,21 @@ class LogoManager:
         return first_institution
 
 
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+
+@functools.lru_cache(maxsize=256)
+def _image_size(logo_path: str, mtime_ns: int, file_size: int) -> Tuple[int, int]:
+    """Read (width, height) of an image; mtime and size only key the cache so edited files are re-read"""
+    with open(logo_path, 'rb') as f:
+        header = f.read(24)
+    # PNG stores its dimensions in the IHDR chunk, which must come first
+    if header[:8] == _PNG_SIGNATURE and header[12:16] == b'IHDR':
+        return struct.unpack('>II', header[16:24])
+    with Image.open(logo_path) as img:
+        return img.width, img.height
+
+
 def get_logo_dimensions(logo_path: str, target_height: float) -> Tuple[float, float]:
     """
     Calculate logo width maintaining aspect ratio
@@ -558,15 +717,22 @@ def get_logo_dimensions(logo_path: str, target_height: float) -> Tuple[float, fl
         (width, height) tuple (inches)
     """
     try:
-        with Image.open(logo_path) as img:
-            aspect_ratio = img.width / img.height
-            target_width = target_height * aspect_ratio
-            return target_width, target_height
+        st = os.stat(logo_path)
+        width, height = _image_size(str(logo_path), st.st_mtime_ns, st.st_size)
+        aspect_ratio = width / height
+        target_width = target_height * aspect_ratio
+        return target_width, target_height
     except Exception:
         # If unable to read image, return square
         return target_height, target_height
 
 
+@functools.lru_cache(maxsize=8)
+def _get_manager(base_path: str) -> LogoManager:
+    """Shared LogoManager per storage path, so its directories are only set up once"""
+    return LogoManager(base_path)
+
+
 def logo_manager_tool(
     action: str,
     base_path: str = None,
@@ -576,7 +742,7 @@ def logo_manager_tool(
     Logo manager tool entry function
 
     Args:
-        action: Action type (get_logo, get_logo_url, list_logos, extract_institution, get_dimensions)
+        action: Action type (get_logo, get_logos_batch, get_logo_url, list_logos, extract_institution, get_dimensions)
         base_path: Base path for logo storage (if not provided, reads from environment variable LOGO_STORE_BASE_PATH, defaults to "logo_store")
         **kwargs: Parameters required for each action
 
@@ -588,23 +754,13 @@ def logo_manager_tool(
         if base_path is None:
             base_path = os.getenv('LOGO_STORE_BASE_PATH', 'logo_store')
 
-        manager = LogoManager(base_path)
-
-        if action == "get_logo":
-            return _get_logo(manager, **kwargs)
-        elif action == "get_logo_url":
-            return _get_logo_url(manager, **kwargs)
-        elif action == "list_logos":
-            return _list_logos(manager)
-        elif action == "extract_institution":
-            return _extract_institution(manager, **kwargs)
-        elif action == "get_dimensions":
-            return _get_dimensions(**kwargs)
-        else:
+        handler = _ACTIONS.get(action)
+        if handler is None:
             return {
                 "status": "error",
-                "error": f"Unknown action: {action}. Available actions: get_logo, get_logo_url, list_logos, extract_institution, get_dimensions"
+                "error": f"Unknown action: {action}. Available actions: {', '.join(_ACTIONS)}"
             }
+        return handler(_get_manager(base_path), **kwargs)
     except Exception as e:
         logger.error(f"Error executing action '{action}': {e}", exc_info=True)
         return {
@@ -643,6 +799,38 @@ def _get_logo(manager: LogoManager, name: str = "", category: str = "auto", use_
         }
 
 
+def _get_logos_batch(manager: LogoManager, names: List[str] = None, category: str = "auto",
+                     use_google: bool = False, **kwargs) -> Dict[str, Any]:
+    """Get logo paths for several names at once"""
+    if not names:
+        return {
+            "status": "error",
+            "error": "Parameter 'names' is required for get_logos_batch action"
+        }
+
+    logo_paths = manager.get_logos_batch(names, category, use_google)
+
+    results = []
+    for name in names:
+        logo_path = logo_paths.get(name)
+        if logo_path and logo_path.exists():
+            results.append({"name": name, "logo_path": str(logo_path.absolute()), "status": "success"})
+        else:
+            results.append({"name": name, "error": f"Could not find or download logo for '{name}'", "status": "error"})
+    success_count = sum(1 for result in results if result["status"] == "success")
+
+    return {
+        "status": "success",
+        "action": "get_logos_batch",
+        "category": category,
+        "message": f"Batch logo lookup completed, successful: {success_count}/{len(names)}",
+        "results": results,
+        "total": len(names),
+        "success_count": success_count,
+        "failed_count": len(names) - success_count
+    }
+
+
 def _list_logos(manager: LogoManager, **kwargs) -> Dict[str, Any]:
     """List all available logos"""
     available_logos = manager.list_available_logos()
@@ -682,7 +870,7 @@ def _extract_institution(manager: LogoManager, paper_content: str = "", **kwargs
         }
 
 
-def _get_dimensions(logo_path: str = "", target_height: float = 0, **kwargs) -> Dict[str, Any]:
+def _get_dimensions(manager: LogoManager, logo_path: str = "", target_height: float = 0, **kwargs) -> Dict[str, Any]:
     """Get logo dimensions (maintaining aspect ratio)"""
     if not logo_path:
         return {
@@ -758,6 +946,16 @@ def _get_logo_url(manager: LogoManager, name: str = "", use_google: bool = False
         }
 
 
+_ACTIONS: Dict[str, Callable[..., Dict[str, Any]]] = {
+    "get_logo": _get_logo,
+    "get_logos_batch": _get_logos_batch,
+    "get_logo_url": _get_logo_url,
+    "list_logos": _list_logos,
+    "extract_institution": _extract_institution,
+    "get_dimensions": _get_dimensions,
+}
+
+
 def main():
     """Test function to demonstrate logo manager tool functionality."""
     print("Logo Manager Tool Testing Started...")
@@ -19,16 +19,15 @@ Generates academic poster HTML based on Markdown content and image caption infor
 
 import os
 import re
+import importlib.util
 import json
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
-# Check dependencies
-try:
-    from openai import OpenAI
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
+from ._openai_client import get_openai_client
+
+# Check dependencies without importing them; openai is imported on first use
+OPENAI_AVAILABLE = importlib.util.find_spec("openai") is not None
 
 try:
     from dotenv import load_dotenv
@@ -149,8 +148,10 @@ def _read_file(file_path: str) -> str:
 
 
 def _save_file(file_path: str, content: str) -> None:
-    """Save file content"""
-    os.makedirs(os.path.dirname(file_path) if os.path.dirname(file_path) else ".", exist_ok=True)
+    """Save file content, creating the parent directory only if it is missing"""
+    parent_dir = os.path.dirname(file_path)
+    if parent_dir and not os.path.isdir(parent_dir):
+        os.makedirs(parent_dir, exist_ok=True)
     with open(file_path, 'w', encoding='utf-8') as f:
         f.write(content)
 
@@ -222,11 +223,8 @@ def _generate_html(markdown_content: str, image_caption_data: List[Dict],
     LLM_API_KEY = os.getenv("LLM_API_KEY")
     LLM_TEMPERATURE = float(os.getenv("LLM_TEMPERATURE") or "0.7")
 
-    # Initialize OpenAI client
-    client = OpenAI(
-        base_url=LLM_BASE_URL,
-        api_key=LLM_API_KEY
-    )
+    # Get (cached) OpenAI client
+    client = get_openai_client(LLM_BASE_URL, LLM_API_KEY)
 
     # Call API
     response = client.chat.completions.create(
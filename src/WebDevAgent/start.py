@@ -15,11 +15,14 @@
 
 """Start the WebDevAgent - An intelligent HTML code generation and optimization AI system."""
 
+import itertools
 import logging
 import os
+import re
 import sys
 from datetime import datetime
 from pathlib import Path
+from typing import Iterator
 
 # ANSI Color codes
 class Colors:
@@ -41,6 +44,13 @@ class Colors:
     BG_GREEN = "\033[102m"
     BG_BLUE = "\033[104m"
 
+
+# Only emit ANSI colors on an interactive terminal, honoring NO_COLOR (https://no-color.org)
+_USE_COLOR = sys.stdout.isatty() and not os.environ.get("NO_COLOR")
+if not _USE_COLOR:
+    for _attr in [name for name in vars(Colors) if name.isupper()]:
+        setattr(Colors, _attr, "")
+
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
@@ -56,22 +66,119 @@ try:
 except ImportError:
     print(f"{Colors.YELLOW}⚠️  python-dotenv not installed, skipping .env file loading{Colors.RESET}")
 
-import langfuse
-from nexau.archs.config.config_loader import load_agent_config
-from prompt_toolkit import prompt
-from prompt_toolkit.history import InMemoryHistory
-from prompt_toolkit.styles import Style
+_QUIET_LOGGERS = ('nexau', 'httpx', 'httpcore')
+
+
+class _QuietFrameworkFilter(logging.Filter):
+    """Drop sub-WARNING framework records at the root handler, before formatting.
+
+    Logger levels alone miss child loggers that set their own level, because
+    propagated records skip the ancestors' level checks.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno >= logging.WARNING or not record.name.startswith(_QUIET_LOGGERS)
+
 
 # Configure logging: only show WARNING and above levels, hide framework's detailed INFO logs
 logging.basicConfig(
     level=logging.WARNING,
     format='%(levelname)s: %(message)s'
 )
+for _handler in logging.getLogger().handlers:
+    _handler.addFilter(_QuietFrameworkFilter())
+
+# Disable nexau framework's detailed logs (rejected in isEnabledFor, before a record is built)
+for _name in _QUIET_LOGGERS:
+    logging.getLogger(_name).setLevel(logging.WARNING)
+
+
+# Line categories for iter_colored_lines, in priority order. The classifier is
+# anchored at the start of the line and categories that may occur anywhere in
+# the line are written as lookaheads, so the first matching branch wins just
+# like a sequential if/elif cascade, but in a single regex call.
+_PATH_PATTERN = r'/[\w/.-]+\.\w+|\\[\w\\.-]+\.\w+|[\w_-]+\.(?:png|pdf|html|json|md)'
+_NUMBER_PATTERN = r'\d+%|\d+x\d+|\d+\.\d+'
+_QUOTE_PATTERN = r'["\'"].+?["\'"]'
+# Category keywords as (English, Chinese) alternatives
+_STEP_WORDS = (('Step',), ('步骤', '阶段'))
+_TOOL_WORDS = (('using tool', 'calling', 'tool call'), ('使用工具', '调用', '执行工具'))
+_SUCCESS_WORDS = (('success', 'done', 'saved', 'generated'), ('成功', '完成', '已生成', '已保存'))
+_ERROR_WORDS = (('error', 'failed', 'warning', 'warn'), ('错误', '失败'))
+_PROCESSING_WORDS = (('processing', 'analyzing'), ('处理中', '正在', '分析中'))
+
+
+def _build_line_classifier(ascii_only: bool) -> re.Pattern:
+    """Compile the line classifier; the ASCII-only variant drops every non-ASCII alternative."""
+    def words(alternatives):
+        english, chinese = alternatives
+        return '|'.join(english if ascii_only else english + chinese)
+
+    bullets = '-*' if ascii_only else '-*•'
+    categories = [
+        ('step', rf'(?i:{words(_STEP_WORDS)})\s*\d+'),
+        ('tool', rf'(?=.*?(?i:{words(_TOOL_WORDS)}))'),
+        ('success', rf'(?=.*?(?i:{words(_SUCCESS_WORDS)}))'),
+        ('error', rf'(?=.*?(?i:{words(_ERROR_WORDS)}))'),
+        ('processing', rf'(?=.*?(?i:{words(_PROCESSING_WORDS)}))'),
+        ('path', rf'(?=.*?(?:{_PATH_PATTERN}))'),
+        ('number', rf'(?=.*?(?:{_NUMBER_PATTERN}))'),
+        ('quote', rf'(?=.*?{_QUOTE_PATTERN})'),
+        ('heading', r'#+\s+'),
+        ('list', rf'\s*[{bullets}]\s+'),
+        ('numlist', r'\s*\d+[\.)]\s+'),
+    ]
+    return re.compile('|'.join(f'(?P<{name}>{pattern})' for name, pattern in categories))
+
+
+# Most response lines are pure ASCII; they get the smaller English-only classifier
+_LINE_CLASSIFIER = _build_line_classifier(ascii_only=False)
+_LINE_CLASSIFIER_ASCII = _build_line_classifier(ascii_only=True)
+
+# A line can only be classified if it contains one of these characters: keyword
+# initials in every case variant IGNORECASE accepts (including 'ſ' for 's'),
+# plus the punctuation the structural patterns require. Plain prose without any
+# of them goes straight to the default formatter without entering the regex.
+_CLASSIFIER_TRIGGER_CHARS = frozenset(
+    'sSſuUcCtTdDgGeEfFwWpPaA'
+    '步阶使调执成完已错失处正分'
+    '.%x"\'#-*•)'
+)
 
-# Disable nexau framework's detailed logs
-logging.getLogger('nexau').setLevel(logging.WARNING)
-logging.getLogger('httpx').setLevel(logging.WARNING)
-logging.getLogger('httpcore').setLevel(logging.WARNING)
+# Secondary patterns, only run on lines already classified into their category
+_TOOL_NAME_RE = re.compile(r'(tool|工具)[:：]?\s*(\w+)', re.IGNORECASE)
+# One pass colors every path, number and quoted span on a path/number/quote line
+_INLINE_RE = re.compile(
+    f'(?P<path>{_PATH_PATTERN})|(?P<number>{_NUMBER_PATTERN})|(?P<quote>{_QUOTE_PATTERN})'
+)
+_HEADING_RE = re.compile(r'^(#+)\s+')
+
+# Line templates, built once: each formatted line is a single `template % content`
+# (the color codes contain no '%', so only the %s slot is substituted)
+# Step markers rotate through these colors, starting from the first step
+_TPL_STEPS = tuple(
+    f"\n{color}{Colors.BOLD}{'▶' * 3} %s{Colors.RESET}"
+    for color in (Colors.MAGENTA, Colors.YELLOW, Colors.GREEN, Colors.CYAN)
+)
+_TPL_TOOL_NAME = f"{Colors.YELLOW}  🔧 Tool call: {Colors.BOLD}%s{Colors.RESET}"
+_TPL_TOOL = f"{Colors.YELLOW}  🔧 %s{Colors.RESET}"
+_TPL_SUCCESS = f"{Colors.GREEN}  ✓ %s{Colors.RESET}"
+_TPL_SUCCESS_MARKED = f"{Colors.GREEN}  %s{Colors.RESET}"
+_TPL_ERROR = f"{Colors.RED}  ✗ %s{Colors.RESET}"
+_TPL_ERROR_MARKED = f"{Colors.RED}  %s{Colors.RESET}"
+_TPL_PROCESSING = f"{Colors.YELLOW}  ⟳ %s{Colors.RESET}"
+_TPL_FILE = f"{Colors.WHITE}  📁 %s{Colors.RESET}"
+_TPL_WHITE = f"{Colors.WHITE}  %s{Colors.RESET}"
+_TPL_HEADING = f"\n{Colors.CYAN}{Colors.BOLD}▸ %s{Colors.RESET}"
+_TPL_LIST = f"{Colors.GREEN}  • %s{Colors.RESET}"
+_TPL_NUMLIST = f"{Colors.CYAN}  %s{Colors.RESET}"
+_HEADING_RULE = f"{Colors.CYAN}{Colors.BOLD}{'═' * 60}{Colors.RESET}"
+_TPL_TITLE = f"\n{_HEADING_RULE}\n{Colors.CYAN}{Colors.BOLD}%s{Colors.RESET}\n{_HEADING_RULE}"
+_TPL_INLINE = {
+    'path': f"{Colors.CYAN}{Colors.BOLD}%s{Colors.RESET}{Colors.WHITE}",
+    'number': f"{Colors.BLUE}{Colors.BOLD}%s{Colors.RESET}{Colors.WHITE}",
+    'quote': f"{Colors.MAGENTA}{Colors.BOLD}%s{Colors.RESET}{Colors.WHITE}",
+}
 
 
 def get_date():
@@ -79,9 +186,86 @@ def get_date():
     return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
 
-def colorize_response(text: str) -> str:
+def _format_tool(line: str) -> str:
+    # Extract tool name
+    tool_match = _TOOL_NAME_RE.search(line)
+    if tool_match:
+        return _TPL_TOOL_NAME % tool_match.group(2)
+    return _TPL_TOOL % line
+
+
+def _format_success(line: str) -> str:
+    if '✓' not in line and '✅' not in line:
+        return _TPL_SUCCESS % line
+    return _TPL_SUCCESS_MARKED % line
+
+
+def _format_error(line: str) -> str:
+    if '✗' not in line and '❌' not in line:
+        return _TPL_ERROR % line
+    return _TPL_ERROR_MARKED % line
+
+
+def _format_processing(line: str) -> str:
+    return _TPL_PROCESSING % line
+
+
+def _inline_repl(match: re.Match) -> str:
+    return _TPL_INLINE[match.lastgroup] % match.group()
+
+
+def _format_path(line: str) -> str:
+    # Colorize path parts (and any numbers/quotes on the same line)
+    line = _INLINE_RE.sub(_inline_repl, line)
+    # If no other markers, add file icon
+    if not line.strip().startswith(('📁', '📄', '🖼️', '✓', '✗', '🔧')):
+        return _TPL_FILE % line
+    return _TPL_WHITE % line
+
+
+def _format_inline(line: str) -> str:
+    # Numbers, percentages, dimensions and quoted content
+    return _TPL_WHITE % _INLINE_RE.sub(_inline_repl, line)
+
+
+def _format_heading(line: str) -> str:
+    level = len(_HEADING_RE.match(line).group(1))
+    if level == 1:
+        return _TPL_TITLE % line
+    return _TPL_HEADING % line.lstrip('#').strip()
+
+
+def _format_list(line: str) -> str:
+    return _TPL_LIST % line.lstrip('-*• ').strip()
+
+
+def _format_numlist(line: str) -> str:
+    return _TPL_NUMLIST % line
+
+
+def _format_default(line: str) -> str:
+    # Default white, add indentation
+    return _TPL_WHITE % line
+
+
+_LINE_FORMATTERS = {
+    'tool': _format_tool,
+    'success': _format_success,
+    'error': _format_error,
+    'processing': _format_processing,
+    'path': _format_path,
+    'number': _format_inline,
+    'quote': _format_inline,
+    'heading': _format_heading,
+    'list': _format_list,
+    'numlist': _format_numlist,
+    None: _format_default,
+}
+
+
+def iter_colored_lines(text: str) -> Iterator[str]:
     """
-    Add rich colors and markers to Agent responses
+    Add rich colors and markers to Agent responses, yielding one output line at a time
 
     Supported patterns:
     - Tool calls → Yellow + 🔧
@@ -92,116 +276,42 @@ def colorize_response(text: str) -> str:
     - Quoted content → Magenta
     - Step markers → Numbered colored markers
     """
-    import re
+    # Plain output (piped, redirected or NO_COLOR): skip classification entirely
+    if not _USE_COLOR:
+        yield from text.split('\n')
+        return
 
-    lines = text.split('\n')
-    colored_lines = []
-    step_counter = 0
+    # Use different colors in rotation
+    step_templates = itertools.cycle(_TPL_STEPS)
 
-    for line in lines:
+    for line in text.split('\n'):
         # Keep empty lines as-is
         if not line.strip():
-            colored_lines.append(line)
+            yield line
             continue
 
-        # Step markers (Step 1, 步骤 1, 1., etc)
-        step_match = re.match(r'^(Step|步骤|阶段)\s*(\d+)', line, re.IGNORECASE)
-        if step_match:
-            step_counter += 1
-            # Use different colors in rotation
-            step_colors = [Colors.CYAN, Colors.MAGENTA, Colors.YELLOW, Colors.GREEN]
-            color = step_colors[step_counter % len(step_colors)]
-            colored_lines.append(f"\n{color}{Colors.BOLD}{'▶' * 3} {line}{Colors.RESET}")
+        # Literal fast path for lines no category can match
+        if _CLASSIFIER_TRIGGER_CHARS.isdisjoint(line):
+            yield _format_default(line)
             continue
 
-        # Tool calls
-        if re.search(r'(使用工具|using tool|calling|tool call|调用|执行工具)', line, re.IGNORECASE):
-            # Extract tool name
-            tool_match = re.search(r'(tool|工具)[:：]?\s*(\w+)', line, re.IGNORECASE)
-            if tool_match:
-                tool_name = tool_match.group(2)
-                colored_lines.append(f"{Colors.YELLOW}  🔧 Tool call: {Colors.BOLD}{tool_name}{Colors.RESET}")
-            else:
-                colored_lines.append(f"{Colors.YELLOW}  🔧 {line}{Colors.RESET}")
-            continue
+        classifier = _LINE_CLASSIFIER_ASCII if line.isascii() else _LINE_CLASSIFIER
+        match = classifier.match(line)
+        kind = match.lastgroup if match else None
 
-        # Success messages
-        if re.search(r'(success|成功|完成|done|saved|generated|已生成|已保存)', line, re.IGNORECASE):
-            if '✓' not in line and '✅' not in line:
-                colored_lines.append(f"{Colors.GREEN}  ✓ {line}{Colors.RESET}")
-            else:
-                colored_lines.append(f"{Colors.GREEN}  {line}{Colors.RESET}")
-            continue
-
-        # Errors/warnings
-        if re.search(r'(error|错误|失败|failed|warning|warn)', line, re.IGNORECASE):
-            if '✗' not in line and '❌' not in line:
-                colored_lines.append(f"{Colors.RED}  ✗ {line}{Colors.RESET}")
-            else:
-                colored_lines.append(f"{Colors.RED}  {line}{Colors.RESET}")
-            continue
-
-        # Processing/in progress
-        if re.search(r'(processing|处理中|正在|analyzing|分析中)', line, re.IGNORECASE):
-            colored_lines.append(f"{Colors.YELLOW}  ⟳ {line}{Colors.RESET}")
-            continue
-
-        # File paths
-        if re.search(r'(/[\w/.-]+\.\w+|\\[\w\\.-]+\.\w+|[\w_-]+\.(png|pdf|html|json|md))', line):
-            # Colorize path parts
-            line = re.sub(
-                r'(/[\w/.-]+\.\w+|\\[\w\\.-]+\.\w+|[\w_-]+\.(png|pdf|html|json|md))',
-                f'{Colors.CYAN}{Colors.BOLD}\\g<0>{Colors.RESET}{Colors.WHITE}',
-                line
-            )
-            # If no other markers, add file icon
-            if not line.strip().startswith(('📁', '📄', '🖼️', '✓', '✗', '🔧')):
-                colored_lines.append(f"{Colors.WHITE}  📁 {line}{Colors.RESET}")
-            else:
-                colored_lines.append(f"{Colors.WHITE}  {line}{Colors.RESET}")
-            continue
-
-        # Numbers, percentages, dimensions
-        if re.search(r'\d+%|\d+x\d+|\d+\.\d+', line):
-            line = re.sub(r'(\d+%|\d+x\d+|\d+\.\d+)', f'{Colors.BLUE}{Colors.BOLD}\\1{Colors.RESET}{Colors.WHITE}', line)
-            colored_lines.append(f"{Colors.WHITE}  {line}{Colors.RESET}")
-            continue
-
-        # Quoted content
-        if re.search(r'["\'"](.+?)["\'"]', line):
-            line = re.sub(
-                r'(["\'"])(.+?)(["\'"])',
-                f'{Colors.MAGENTA}{Colors.BOLD}\\1\\2\\3{Colors.RESET}{Colors.WHITE}',
-                line
-            )
-            colored_lines.append(f"{Colors.WHITE}  {line}{Colors.RESET}")
-            continue
-
-        # Heading lines (## or ###)
-        if re.match(r'^#+\s+', line):
-            level = len(re.match(r'^(#+)', line).group(1))
-            if level == 1:
-                colored_lines.append(f"\n{Colors.CYAN}{Colors.BOLD}{'═' * 60}{Colors.RESET}")
-                colored_lines.append(f"{Colors.CYAN}{Colors.BOLD}{line}{Colors.RESET}")
-                colored_lines.append(f"{Colors.CYAN}{Colors.BOLD}{'═' * 60}{Colors.RESET}")
-            else:
-                colored_lines.append(f"\n{Colors.CYAN}{Colors.BOLD}▸ {line.lstrip('#').strip()}{Colors.RESET}")
-            continue
-
-        # List items
-        if re.match(r'^\s*[-*•]\s+', line):
-            colored_lines.append(f"{Colors.GREEN}  • {line.lstrip('-*• ').strip()}{Colors.RESET}")
+        # Step markers (Step 1, 步骤 1, 1., etc)
+        if kind == 'step':
+            yield next(step_templates) % line
             continue
 
-        # Numbered lists
-        if re.match(r'^\s*\d+[\.)]\s+', line):
-            colored_lines.append(f"{Colors.CYAN}  {line}{Colors.RESET}")
-            continue
+        yield _LINE_FORMATTERS[kind](line)
 
-        # Default white, add indentation
-        colored_lines.append(f"{Colors.WHITE}  {line}{Colors.RESET}")
 
-    return '\n'.join(colored_lines)
+def colorize_response(text: str) -> str:
+    """Add rich colors and markers to Agent responses (see iter_colored_lines)."""
+    if not _USE_COLOR:
+        return text
+    return '\n'.join(iter_colored_lines(text))
 
 
 def main():
@@ -223,6 +333,13 @@ def main():
             print()
             return 1
 
+        # Heavy framework imports are deferred until the startup checks pass
+        import langfuse
+        from nexau.archs.config.config_loader import load_agent_config
+        from prompt_toolkit import prompt
+        from prompt_toolkit.history import InMemoryHistory
+        from prompt_toolkit.styles import Style
+
         # Setup prompt_toolkit
         history = InMemoryHistory()
         prompt_style = Style.from_dict({
@@ -234,8 +351,10 @@ def main():
         print(f"{Colors.CYAN}💡 Each task is an independent conversation, no history context retained{Colors.RESET}")
         print(f"{Colors.CYAN}{'-' * 70}{Colors.RESET}")
 
-        # Get script directory for loading config
-        script_dir = Path(__file__).parent
+        # Each task runs on its own freshly loaded agent, so conversations never share history
+        # or live clients. The first agent is loaded now; later ones are loaded as their task starts
+        config_path = str(Path(__file__).parent / "config.yaml")
+        webdev_agent = load_agent_config(config_path)
 
         while True:
             try:
@@ -258,9 +377,10 @@ def main():
                 print(f"\n{Colors.CYAN}👋 Goodbye!{Colors.RESET}")
                 break
 
-            # Reload Agent for each task to ensure independent conversation context
+            # Fresh Agent for each task to ensure independent conversation context
             print(f"{Colors.BLUE}⚙️  Initializing independent conversation...{Colors.RESET}")
-            webdev_agent = load_agent_config(str(script_dir / "config.yaml"))
+            if webdev_agent is None:
+                webdev_agent = load_agent_config(config_path)
 
             print(f"\n{Colors.MAGENTA}{Colors.BOLD}╭{'─' * 68}╮{Colors.RESET}")
             print(f"{Colors.MAGENTA}{Colors.BOLD}│ 🤖 WebDevAgent Response{' ' * 44}│{Colors.RESET}")
@@ -280,9 +400,9 @@ def main():
                     },
                 },
             )
-            # Use colored output
-            colored_response = colorize_response(response)
-            print(colored_response)
+            # Use colored output; one write, since a line-buffered TTY flushes on every newline write
+            sys.stdout.write(colorize_response(response) + '\n')
+            sys.stdout.flush()
             print(f"\n{Colors.CYAN}{'═' * 70}{Colors.RESET}")
 
             if webdev_agent.langfuse_trace_id:
@@ -295,6 +415,9 @@ def main():
                 except Exception:
                     pass
 
+            # The next task loads its own agent
+            webdev_agent = None
+
     except KeyboardInterrupt:
         print(f"\n\n{Colors.YELLOW}👋 WebDevAgent interrupted by user{Colors.RESET}")
         return 0